@@ -0,0 +1,189 @@
+"""Redis-backed response caching for read-heavy list endpoints.
+
+Cached payloads are keyed on the endpoint namespace plus its query parameters.
+Each namespace carries a version counter; mutating endpoints bump it via
+:func:`invalidate` so stale pages simply stop being addressed and age out
+through their TTL. When Redis is unavailable the decorator falls through to
+the wrapped endpoint, so the API never depends on the cache being up.
+
+Responses are shared between callers, so endpoints that start returning
+per-user data once ``require_user`` is implemented must not be cached.
+
+Every fresh result is also kept under a version-independent "stale" key with
+a longer TTL. If the endpoint then fails because the database is unreachable
+(e.g. Postgres restarting during a deploy) the last good copy is served with
+``X-Cache: stale`` instead of a 500. Other database errors, such as a bad
+query, still propagate.
+
+Validator headers (``ETag``, ``X-Total-Count``) set by the endpoint are
+stored with the body and replayed on hits, including answering a matching
+``If-None-Match`` with ``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, TypeVar
+
+from fastapi import Response, status
+from fastapi.encoders import jsonable_encoder
+from redis import Redis, RedisError
+from sqlalchemy.exc import InterfaceError, OperationalError
+
+from api.etag import etag_matches
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "gtsc"
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "30"))
+RESPONSE_CACHE_STALE_TTL = int(os.getenv("RESPONSE_CACHE_STALE_TTL", "3600"))
+_RETRY_AFTER_SECONDS = 30.0
+_UNKEYED_PARAMS = frozenset({"db", "request", "response"})
+_REPLAYED_HEADERS = ("etag", "x-total-count")
+
+_client: Redis | None = None
+_unavailable_until = 0.0
+
+EndpointFn = TypeVar("EndpointFn", bound=Callable[..., Any])
+
+
+def _get_client() -> Redis | None:
+    global _client
+    if RESPONSE_CACHE_TTL <= 0 or time.monotonic() < _unavailable_until:
+        return None
+    if _client is None:
+        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        _client = Redis.from_url(redis_url, socket_timeout=0.25, socket_connect_timeout=0.25)
+    return _client
+
+
+def _mark_unavailable() -> None:
+    # Back off for a while so a missing Redis does not add a connect timeout
+    # to every request.
+    global _unavailable_until
+    _unavailable_until = time.monotonic() + _RETRY_AFTER_SECONDS
+    logger.warning("Response cache unavailable; serving uncached responses")
+
+
+def _version_key(namespace: str) -> str:
+    return f"{CACHE_PREFIX}:{namespace}:version"
+
+
+def _params_digest(params: dict[str, Any]) -> str:
+    encoded = json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(encoded, usedforsecurity=False).hexdigest()
+
+
+def _response_key(namespace: str, version: bytes | None, digest: str) -> str:
+    return f"{CACHE_PREFIX}:{namespace}:{(version or b'0').decode()}:{digest}"
+
+
+def _stale_key(namespace: str, digest: str) -> str:
+    # Not versioned: after an invalidation the previous copy is still a
+    # better answer than an error while the database is unreachable.
+    return f"{CACHE_PREFIX}:{namespace}:stale:{digest}"
+
+
+def _serve_stale(client: Redis, stale_key: str) -> Response | None:
+    try:
+        stale = client.get(stale_key)
+    except RedisError:
+        _mark_unavailable()
+        return None
+    if stale is None:
+        return None
+    entry = json.loads(stale)
+    headers = {**entry["headers"], "X-Cache": "stale"}
+    return Response(content=json.dumps(entry["body"]), media_type="application/json", headers=headers)
+
+
+def cached_response(namespace: str, expire: int | None = None) -> Callable[[EndpointFn], EndpointFn]:
+    """Cache a JSON-serializable endpoint result in Redis.
+
+    The ``db`` session and the ``request``/``response`` objects are excluded
+    from the cache key; every other keyword argument (query parameters,
+    pagination) is part of it. Results that are already ``Response`` objects
+    (e.g. a 304) are passed through uncached.
+    """
+
+    ttl = expire if expire is not None else RESPONSE_CACHE_TTL
+
+    def decorator(func: EndpointFn) -> EndpointFn:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            client = _get_client()
+            if client is None:
+                return func(*args, **kwargs)
+
+            params = {name: value for name, value in kwargs.items() if name not in _UNKEYED_PARAMS}
+            digest = _params_digest(params)
+            try:
+                key = _response_key(namespace, client.get(_version_key(namespace)), digest)
+                cached = client.get(key)
+            except RedisError:
+                _mark_unavailable()
+                return func(*args, **kwargs)
+
+            request = kwargs.get("request")
+            response = kwargs.get("response")
+            if cached is not None:
+                entry = json.loads(cached)
+                headers: dict[str, str] = entry["headers"]
+                etag = headers.get("etag")
+                if request is not None and etag and etag_matches(request, etag):
+                    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+                if response is not None:
+                    response.headers.update(headers)
+                return entry["body"]
+
+            try:
+                result = func(*args, **kwargs)
+            except (OperationalError, InterfaceError):
+                stale_response = _serve_stale(client, _stale_key(namespace, digest))
+                if stale_response is None:
+                    raise
+                logger.warning("Database error; serving stale %s response", namespace, exc_info=True)
+                return stale_response
+            if isinstance(result, Response):
+                return result
+            body = jsonable_encoder(result)
+            headers = {}
+            if response is not None:
+                headers = {
+                    name: response.headers[name] for name in _REPLAYED_HEADERS if name in response.headers
+                }
+            entry = json.dumps({"headers": headers, "body": body})
+            try:
+                pipe = client.pipeline(transaction=False)
+                pipe.set(key, entry, ex=ttl)
+                pipe.set(_stale_key(namespace, digest), entry, ex=RESPONSE_CACHE_STALE_TTL)
+                pipe.execute()
+            except RedisError:
+                _mark_unavailable()
+            return body
+
+        # Route modules use postponed annotations; resolve them against the
+        # endpoint's own module so FastAPI can still detect Request/Response.
+        wrapper.__signature__ = inspect.signature(func, eval_str=True)  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def invalidate(namespace: str) -> None:
+    """Drop every cached response for ``namespace``."""
+
+    client = _get_client()
+    if client is None:
+        return
+    try:
+        client.incr(_version_key(namespace))
+    except RedisError:
+        _mark_unavailable()
@@ -1,6 +1,7 @@
 """Database session dependencies."""
 
 from collections.abc import Generator
+from functools import lru_cache
 
 from fastapi import Depends
 
@@ -14,3 +15,8 @@ def get_db() -> Generator:
     finally:
         db.close()
 
+
+@lru_cache(maxsize=1)
+def get_dialect_name() -> str:
+    """Dialect of the bound engine; fixed for the life of the process."""
+    return SessionLocal.kw["bind"].dialect.name
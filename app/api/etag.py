@@ -0,0 +1,36 @@
+"""ETag helpers for conditional GETs on list endpoints.
+
+A list ETag fingerprints the filtered row set by ``max(updated_at)`` and its
+row count, plus the request's query parameters. Only tables whose
+``updated_at`` is bumped on every write can use it; otherwise an edit could
+leave the fingerprint unchanged and clients would keep a stale page.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import Request
+from sqlalchemy import Select, func
+from sqlalchemy.orm import Session
+
+
+def list_etag(db: Session, stmt: Select[Any], updated_at_column: Any, request: Request) -> tuple[str, int]:
+    """Return the ETag for ``stmt`` and the number of rows it matches."""
+
+    fingerprint = stmt.with_only_columns(
+        func.max(updated_at_column), func.count(), maintain_column_froms=True
+    ).order_by(None)
+    last_updated, total = db.execute(fingerprint).one()
+    params = sorted(request.query_params.multi_items())
+    digest = hashlib.blake2b(f"{last_updated}-{total}-{params}".encode(), digest_size=8)
+    return f'"{digest.hexdigest()}"', total
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return etag in candidates or "*" in candidates
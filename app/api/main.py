@@ -1,28 +1,41 @@
 from __future__ import annotations
 
-import logging
+import os
 from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from api.routes import candidates, health, logs, runs, schedules, talent
-from connectors import caha_pdf, events, instagram_stub, reddit, tiktok_stub  # noqa: F401
-from workers.scheduler import enqueue_due_jobs
+from models.session import DB_MAX_OVERFLOW, DB_POOL_SIZE
+
+
+# Sync endpoints run on AnyIO's worker threads (40 by default). Size that pool
+# from the DB connection pool so neither caps the other, with some headroom
+# for endpoints that never touch the database.
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", str(DB_POOL_SIZE + DB_MAX_OVERFLOW + 10)))
 
 
 def create_app() -> FastAPI:
-    """Application factory for the FastAPI backend."""
-    logger = logging.getLogger(__name__)
+    """Application factory for the FastAPI backend.
+
+    Due connector jobs are enqueued by the worker on startup (see
+    ``workers.worker``), so the API never imports the connectors or the
+    scheduler.
+    """
 
     @asynccontextmanager
     async def lifespan(_: FastAPI):
-        try:
-            enqueue_due_jobs()
-        except Exception:  # pragma: no cover - safety
-            logger.exception("Failed to enqueue due jobs on startup")
+        to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
         yield
 
-    app = FastAPI(title="Guam Talent Scouting Console", version="0.1.0", lifespan=lifespan)
+    app = FastAPI(
+        title="Guam Talent Scouting Console",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     app.include_router(health.router)
     app.include_router(runs.router)
@@ -0,0 +1,57 @@
+"""Pagination helpers shared by the list endpoints."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Select, func
+from sqlalchemy.orm import Session
+
+
+def paginate(
+    db: Session,
+    stmt: Select[Any],
+    page: int,
+    page_size: int,
+    *,
+    scalars: bool = True,
+    total: int | None = None,
+) -> tuple[list[Any], int]:
+    """Return one page of ``stmt`` and the total row count.
+
+    The total is selected as a ``COUNT(*) OVER ()`` window alongside the page
+    so both come back in a single round trip. Only when a page past the end
+    is requested (and therefore no rows carry the window value) do we fall
+    back to a separate count.
+
+    With ``scalars`` the first column of each row is returned (the entity for
+    ``select(Model)``); otherwise the rows themselves, which expose selected
+    columns as attributes.
+
+    Callers that have already counted the filtered set (e.g. for an ETag)
+    pass it as ``total``; the page is then a plain LIMIT/OFFSET with no
+    window column.
+    """
+
+    if total is not None:
+        paged = stmt.offset((page - 1) * page_size).limit(page_size)
+        result = db.execute(paged)
+        return (list(result.scalars()) if scalars else list(result)), total
+
+    windowed = (
+        stmt.add_columns(func.count().over().label("_total"))
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )
+    rows = db.execute(windowed).all()
+    if rows:
+        items = [row[0] for row in rows] if scalars else list(rows)
+        return items, rows[0]._total
+    if page == 1:
+        return [], 0
+    # Count over the same FROM/WHERE directly rather than wrapping the page
+    # query in a subquery, so the planner can reuse the filter's index path.
+    total = db.scalar(
+        stmt.with_only_columns(func.count(), maintain_column_froms=True).order_by(None)
+    )
+    return [], total or 0
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import func, insert, select, type_coerce, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
+from api.cache import cached_response, invalidate
 from api.deps.auth import require_user
-from api.deps.db import get_db
-from models import Candidate, Source
+from api.deps.db import get_db, get_dialect_name
+from api.etag import etag_matches, list_etag
+from api.pagination import paginate
+from models import CANDIDATE_STATUSES, Candidate, Source
 
 
 router = APIRouter(
@@ -20,10 +23,24 @@ router = APIRouter(
     dependencies=[Depends(require_user)],
 )
 
-_ALLOWED_STATUSES = {"pending", "approved", "watch", "dismissed"}
+_ALLOWED_STATUSES = frozenset(CANDIDATE_STATUSES)
+
+# List pages select plain columns so rows skip ORM instance hydration.
+_CANDIDATE_COLS = (
+    Candidate.id,
+    Candidate.source_id,
+    Candidate.name,
+    Candidate.channel,
+    Candidate.evidence,
+    Candidate.metadata_json,
+    Candidate.status,
+    Candidate.score,
+    Candidate.created_at,
+    Candidate.updated_at,
+)
 
 
-def _serialize_candidate(candidate: Candidate) -> dict[str, Any]:
+def _serialize_candidate(candidate: Any) -> dict[str, Any]:
     return {
         "id": candidate.id,
         "source_id": candidate.source_id,
@@ -32,20 +49,24 @@ def _serialize_candidate(candidate: Candidate) -> dict[str, Any]:
         "evidence": candidate.evidence,
         "metadata": candidate.metadata_json or {},
         "status": candidate.status,
-        "score": float(candidate.score) if isinstance(candidate.score, Decimal) else candidate.score,
+        "score": candidate.score,
         "created_at": candidate.created_at,
         "updated_at": candidate.updated_at,
     }
 
 
-def _json_filter(column, key: str, value: str, dialect_name: str):
-    if dialect_name == "sqlite":
+def _json_filter(column, key: str, value: str):
+    if get_dialect_name() == "sqlite":
         return func.json_extract(column, f"$.{key}") == value
-    return column[key].astext == value  # type: ignore[index]
+    # ``metadata @> '{"key": "value"}'`` is answered by the GIN index.
+    return type_coerce(column, JSONB).contains({key: value})
 
 
 @router.get("/")
+@cached_response("candidates")
 def list_candidates(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
     discipline: str | None = None,
@@ -55,30 +76,35 @@ def list_candidates(
     status_filter: str | None = Query(None, alias="status"),
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
-    query = db.query(Candidate)
-    dialect_name = db.bind.dialect.name  # type: ignore[union-attr]
+    stmt = select(*_CANDIDATE_COLS)
 
     if discipline:
-        query = query.filter(
-            _json_filter(Candidate.metadata_json, "discipline", discipline, dialect_name)
+        stmt = stmt.where(
+            _json_filter(Candidate.metadata_json, "discipline", discipline)
         )
     if affiliation:
-        query = query.filter(
-            _json_filter(Candidate.metadata_json, "affiliation", affiliation, dialect_name)
+        stmt = stmt.where(
+            _json_filter(Candidate.metadata_json, "affiliation", affiliation)
         )
     if min_score is not None:
-        query = query.filter(Candidate.score >= min_score)
+        stmt = stmt.where(Candidate.score >= min_score)
     if max_score is not None:
-        query = query.filter(Candidate.score <= max_score)
+        stmt = stmt.where(Candidate.score <= max_score)
     if status_filter:
-        query = query.filter(Candidate.status == status_filter)
-
-    total = query.count()
-    candidates = (
-        query.order_by(Candidate.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+        # status is a native enum on Postgres, where an unknown literal is a
+        # cast error rather than an empty match.
+        if status_filter not in _ALLOWED_STATUSES:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status value")
+        stmt = stmt.where(Candidate.status == status_filter)
+
+    etag, matched = list_etag(db, stmt, Candidate.updated_at, request)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["X-Total-Count"] = str(matched)
+
+    candidates, total = paginate(
+        db, stmt.order_by(Candidate.created_at.desc()), page, page_size, scalars=False, total=matched
     )
 
     return {
@@ -95,29 +121,78 @@ def create_candidate(payload: dict[str, Any], db: Session = Depends(get_db)) ->
     if source_id is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="source_id is required")
 
-    if db.get(Source, source_id) is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Source not found")
-
-    candidate = Candidate(
-        source_id=source_id,
-        name=payload.get("name"),
-        channel=payload.get("channel"),
-        evidence=payload.get("evidence"),
-        metadata_json=payload.get("metadata") or {},
-        score=payload.get("score"),
-        status=payload.get("status", "pending"),
-    )
+    values = {
+        "source_id": source_id,
+        "name": payload.get("name"),
+        "channel": payload.get("channel"),
+        "evidence": payload.get("evidence"),
+        "metadata_json": payload.get("metadata") or {},
+        "score": payload.get("score"),
+        "status": payload.get("status", "pending"),
+    }
 
-    if candidate.name is None or candidate.channel is None:
+    if values["name"] is None or values["channel"] is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="name and channel are required")
 
-    if candidate.status not in _ALLOWED_STATUSES:
+    if values["status"] not in _ALLOWED_STATUSES:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status value")
 
-    db.add(candidate)
+    if db.get(Source, source_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Source not found")
+
+    row = db.execute(insert(Candidate).values(**values).returning(*_CANDIDATE_COLS)).one()
     db.commit()
-    db.refresh(candidate)
-    return _serialize_candidate(candidate)
+    invalidate("candidates")
+    return _serialize_candidate(row)
+
+
+@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+def bulk_create_candidates(
+    payload: list[dict[str, Any]], db: Session = Depends(get_db)
+) -> list[dict[str, Any]]:
+    if not payload:
+        return []
+
+    rows: list[dict[str, Any]] = []
+    for index, item in enumerate(payload):
+        if item.get("source_id") is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=f"Item {index}: source_id is required"
+            )
+        if item.get("name") is None or item.get("channel") is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Item {index}: name and channel are required",
+            )
+        status_value = item.get("status", "pending")
+        if status_value not in _ALLOWED_STATUSES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=f"Item {index}: Invalid status value"
+            )
+        rows.append(
+            {
+                "source_id": item["source_id"],
+                "name": item["name"],
+                "channel": item["channel"],
+                "evidence": item.get("evidence"),
+                "metadata_json": item.get("metadata") or {},
+                "score": item.get("score"),
+                "status": status_value,
+            }
+        )
+
+    source_ids = {row["source_id"] for row in rows}
+    found = set(db.scalars(select(Source.id).where(Source.id.in_(source_ids))))
+    if found != source_ids:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Source not found")
+
+    # One executemany INSERT ... RETURNING instead of a round trip per candidate.
+    created = db.execute(
+        insert(Candidate).returning(*_CANDIDATE_COLS, sort_by_parameter_order=True), rows
+    ).all()
+    db.commit()
+    invalidate("candidates")
+    return [_serialize_candidate(row) for row in created]
 
 
 @router.get("/{candidate_id}")
@@ -130,24 +205,32 @@ def get_candidate(candidate_id: int, db: Session = Depends(get_db)) -> dict[str,
 
 @router.put("/{candidate_id}")
 def update_candidate(candidate_id: int, payload: dict[str, Any], db: Session = Depends(get_db)) -> dict[str, Any]:
-    candidate = db.get(Candidate, candidate_id)
-    if candidate is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Candidate not found")
-
+    values: dict[str, Any] = {}
     for field in ("name", "channel", "evidence", "metadata", "score", "status"):
         if field in payload:
             if field == "metadata":
-                setattr(candidate, "metadata_json", payload[field] or {})
+                values["metadata_json"] = payload[field] or {}
             else:
-                setattr(candidate, field, payload[field])
+                values[field] = payload[field]
 
-    if candidate.status not in _ALLOWED_STATUSES:
+    if "status" in values and values["status"] not in _ALLOWED_STATUSES:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status value")
 
-    db.add(candidate)
+    if not values:
+        return get_candidate(candidate_id, db)
+
+    row = db.execute(
+        update(Candidate)
+        .where(Candidate.id == candidate_id)
+        .values(**values)
+        .returning(*_CANDIDATE_COLS)
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Candidate not found")
+
     db.commit()
-    db.refresh(candidate)
-    return _serialize_candidate(candidate)
+    invalidate("candidates")
+    return _serialize_candidate(row)
 
 
 @router.delete("/{candidate_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
@@ -158,19 +241,24 @@ def delete_candidate(candidate_id: int, db: Session = Depends(get_db)) -> Respon
 
     db.delete(candidate)
     db.commit()
+    invalidate("candidates")
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 def _transition_candidate(candidate_id: int, status_value: str, db: Session) -> dict[str, Any]:
-    candidate = db.get(Candidate, candidate_id)
-    if candidate is None:
+    # A single UPDATE ... RETURNING replaces the load/mutate/flush/refresh round trips.
+    row = db.execute(
+        update(Candidate)
+        .where(Candidate.id == candidate_id)
+        .values(status=status_value)
+        .returning(*_CANDIDATE_COLS)
+    ).first()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Candidate not found")
 
-    candidate.status = status_value
-    db.add(candidate)
     db.commit()
-    db.refresh(candidate)
-    return _serialize_candidate(candidate)
+    invalidate("candidates")
+    return _serialize_candidate(row)
 
 
 @router.post("/{candidate_id}/approve")
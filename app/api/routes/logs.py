@@ -6,10 +6,13 @@ from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
+from api.cache import cached_response, invalidate
 from api.deps.auth import require_user
 from api.deps.db import get_db
+from api.pagination import paginate
 from models import Source
 
 
@@ -20,7 +23,19 @@ router = APIRouter(
 )
 
 
-def _serialize_source(source: Source) -> dict[str, Any]:
+_SOURCE_COLS = (
+    Source.id,
+    Source.channel,
+    Source.url,
+    Source.kind,
+    Source.fetched_at,
+    Source.content_hash,
+    Source.raw_blob_ptr,
+    Source.meta,
+)
+
+
+def _serialize_source(source: Any) -> dict[str, Any]:
     return {
         "id": source.id,
         "channel": source.channel,
@@ -43,6 +58,7 @@ def _coerce_datetime(value: Any) -> datetime | None:
 
 
 @router.get("/")
+@cached_response("logs")
 def list_logs(
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
@@ -50,20 +66,14 @@ def list_logs(
     kind: str | None = None,
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
-    query = db.query(Source)
+    stmt = select(Source)
 
     if channel:
-        query = query.filter(Source.channel == channel)
+        stmt = stmt.where(Source.channel == channel)
     if kind:
-        query = query.filter(Source.kind == kind)
+        stmt = stmt.where(Source.kind == kind)
 
-    total = query.count()
-    logs = (
-        query.order_by(Source.fetched_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
-    )
+    logs, total = paginate(db, stmt.order_by(Source.fetched_at.desc()), page, page_size)
 
     return {
         "items": [_serialize_source(source) for source in logs],
@@ -83,20 +93,22 @@ def create_log(payload: dict[str, Any], db: Session = Depends(get_db)) -> dict[s
             detail="channel and fetched_at are required",
         )
 
-    source = Source(
-        channel=channel,
-        url=payload.get("url"),
-        kind=payload.get("kind"),
-        fetched_at=_coerce_datetime(fetched_at),
-        content_hash=payload.get("content_hash"),
-        raw_blob_ptr=payload.get("raw_blob_ptr"),
-        meta=payload.get("meta") or {},
-    )
-
-    db.add(source)
+    row = db.execute(
+        insert(Source)
+        .values(
+            channel=channel,
+            url=payload.get("url"),
+            kind=payload.get("kind"),
+            fetched_at=_coerce_datetime(fetched_at),
+            content_hash=payload.get("content_hash"),
+            raw_blob_ptr=payload.get("raw_blob_ptr"),
+            meta=payload.get("meta") or {},
+        )
+        .returning(*_SOURCE_COLS)
+    ).one()
     db.commit()
-    db.refresh(source)
-    return _serialize_source(source)
+    invalidate("logs")
+    return _serialize_source(row)
 
 
 @router.get("/{log_id}")
@@ -109,21 +121,26 @@ def get_log(log_id: int, db: Session = Depends(get_db)) -> dict[str, Any]:
 
 @router.put("/{log_id}")
 def update_log(log_id: int, payload: dict[str, Any], db: Session = Depends(get_db)) -> dict[str, Any]:
-    source = db.get(Source, log_id)
-    if source is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Log not found")
-
+    values: dict[str, Any] = {}
     for field in ("channel", "url", "kind", "fetched_at", "content_hash", "raw_blob_ptr", "meta"):
         if field in payload:
             value = payload[field]
             if field == "fetched_at":
                 value = _coerce_datetime(value)
-            setattr(source, field, value)
+            values[field] = value
+
+    if not values:
+        return get_log(log_id, db)
+
+    row = db.execute(
+        update(Source).where(Source.id == log_id).values(**values).returning(*_SOURCE_COLS)
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Log not found")
 
-    db.add(source)
     db.commit()
-    db.refresh(source)
-    return _serialize_source(source)
+    invalidate("logs")
+    return _serialize_source(row)
 
 
 @router.delete("/{log_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
@@ -134,4 +151,7 @@ def delete_log(log_id: int, db: Session = Depends(get_db)) -> Response:
 
     db.delete(source)
     db.commit()
+    invalidate("logs")
+    # Candidates cascade with their source.
+    invalidate("candidates")
     return Response(status_code=status.HTTP_204_NO_CONTENT)
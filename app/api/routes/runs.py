@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
+from api.cache import cached_response
 from api.deps.db import get_db
 from models import Run
 
@@ -11,6 +12,7 @@ router = APIRouter(prefix="/api/runs", tags=["runs"])
 
 
 @router.get("/")
+@cached_response("runs")
 def list_runs(db: Session = Depends(get_db)) -> list[dict]:
     runs = db.query(Run).order_by(Run.started_at.desc()).limit(50).all()
     return [
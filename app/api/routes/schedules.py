@@ -6,10 +6,14 @@ from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from api.cache import cached_response, invalidate
 from api.deps.auth import require_user
 from api.deps.db import get_db
+from api.pagination import paginate
 from models import Schedule
 
 
@@ -20,7 +24,16 @@ router = APIRouter(
 )
 
 
-def _serialize_schedule(schedule: Schedule) -> dict[str, Any]:
+_SCHEDULE_COLS = (
+    Schedule.connector,
+    Schedule.cadence_cron,
+    Schedule.last_run_at,
+    Schedule.next_due_at,
+    Schedule.enabled,
+)
+
+
+def _serialize_schedule(schedule: Any) -> dict[str, Any]:
     return {
         "connector": schedule.connector,
         "cadence_cron": schedule.cadence_cron,
@@ -40,23 +53,18 @@ def _coerce_datetime(value: Any) -> datetime | None:
 
 
 @router.get("/")
+@cached_response("schedules")
 def list_schedules(
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
     enabled: bool | None = None,
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
-    query = db.query(Schedule)
+    stmt = select(Schedule)
     if enabled is not None:
-        query = query.filter(Schedule.enabled.is_(enabled))
+        stmt = stmt.where(Schedule.enabled == enabled)
 
-    total = query.count()
-    schedules = (
-        query.order_by(Schedule.connector.asc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
-    )
+    schedules, total = paginate(db, stmt.order_by(Schedule.connector.asc()), page, page_size)
 
     return {
         "items": [_serialize_schedule(schedule) for schedule in schedules],
@@ -76,21 +84,26 @@ def create_schedule(payload: dict[str, Any], db: Session = Depends(get_db)) -> d
             detail="connector and cadence_cron are required",
         )
 
-    if db.get(Schedule, connector) is not None:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Schedule already exists")
-
-    schedule = Schedule(
-        connector=connector,
-        cadence_cron=cadence_cron,
-        last_run_at=_coerce_datetime(payload.get("last_run_at")),
-        next_due_at=_coerce_datetime(payload.get("next_due_at")),
-        enabled=payload.get("enabled", True),
-    )
-
-    db.add(schedule)
-    db.commit()
-    db.refresh(schedule)
-    return _serialize_schedule(schedule)
+    # Let the primary key detect duplicates instead of probing with a SELECT first.
+    try:
+        row = db.execute(
+            insert(Schedule)
+            .values(
+                connector=connector,
+                cadence_cron=cadence_cron,
+                last_run_at=_coerce_datetime(payload.get("last_run_at")),
+                next_due_at=_coerce_datetime(payload.get("next_due_at")),
+                enabled=payload.get("enabled", True),
+            )
+            .returning(*_SCHEDULE_COLS)
+        ).one()
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Schedule already exists") from exc
+
+    invalidate("schedules")
+    return _serialize_schedule(row)
 
 
 @router.get("/{connector}")
@@ -103,21 +116,29 @@ def get_schedule(connector: str, db: Session = Depends(get_db)) -> dict[str, Any
 
 @router.put("/{connector}")
 def update_schedule(connector: str, payload: dict[str, Any], db: Session = Depends(get_db)) -> dict[str, Any]:
-    schedule = db.get(Schedule, connector)
-    if schedule is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Schedule not found")
-
+    values: dict[str, Any] = {}
     for field in ("cadence_cron", "last_run_at", "next_due_at", "enabled"):
         if field in payload:
             value = payload[field]
             if field in {"last_run_at", "next_due_at"}:
                 value = _coerce_datetime(value)
-            setattr(schedule, field, value)
+            values[field] = value
+
+    if not values:
+        return get_schedule(connector, db)
+
+    row = db.execute(
+        update(Schedule)
+        .where(Schedule.connector == connector)
+        .values(**values)
+        .returning(*_SCHEDULE_COLS)
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Schedule not found")
 
-    db.add(schedule)
     db.commit()
-    db.refresh(schedule)
-    return _serialize_schedule(schedule)
+    invalidate("schedules")
+    return _serialize_schedule(row)
 
 
 @router.delete("/{connector}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
@@ -128,4 +149,5 @@ def delete_schedule(connector: str, db: Session = Depends(get_db)) -> Response:
 
     db.delete(schedule)
     db.commit()
+    invalidate("schedules")
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import ColumnElement, Text, exists, func, insert, literal_column, select, type_coerce, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session
 
+from api.cache import cached_response, invalidate
 from api.deps.auth import require_user
-from api.deps.db import get_db
+from api.deps.db import get_db, get_dialect_name
+from api.etag import etag_matches, list_etag
+from api.pagination import paginate
 from models import Org, Talent, TalentOrg
 
 
@@ -20,7 +24,41 @@ router = APIRouter(
 )
 
 
-def _serialize_talent(talent: Talent) -> dict[str, Any]:
+# List pages select plain columns so rows skip ORM instance hydration (and
+# cannot trigger lazy relationship loads).
+_TALENT_COLS = (
+    Talent.id,
+    Talent.name,
+    Talent.discipline,
+    Talent.subdiscipline,
+    Talent.primary_handle_url,
+    Talent.other_links,
+    Talent.contact_public,
+    Talent.contact_email,
+    Talent.phone,
+    Talent.location_tags,
+    Talent.themes,
+    Talent.notes,
+    Talent.score,
+    Talent.score_json,
+    Talent.created_at,
+    Talent.updated_at,
+)
+
+
+def _tag_filter(column, value: str) -> ColumnElement[bool]:
+    if get_dialect_name() == "sqlite":
+        # SQLite keeps the list as a JSON array.
+        return exists(
+            select(literal_column("1"))
+            .select_from(func.json_each(column))
+            .where(literal_column("value") == value)
+        )
+    # ``themes @> ARRAY[...]`` is answered by the GIN index on the column.
+    return type_coerce(column, ARRAY(Text)).contains([value])
+
+
+def _serialize_talent(talent: Any) -> dict[str, Any]:
     return {
         "id": talent.id,
         "name": talent.name,
@@ -34,7 +72,7 @@ def _serialize_talent(talent: Talent) -> dict[str, Any]:
         "location_tags": talent.location_tags or [],
         "themes": talent.themes or [],
         "notes": talent.notes,
-        "score": float(talent.score) if isinstance(talent.score, Decimal) else talent.score,
+        "score": talent.score,
         "score_json": talent.score_json or {},
         "created_at": talent.created_at,
         "updated_at": talent.updated_at,
@@ -42,34 +80,50 @@ def _serialize_talent(talent: Talent) -> dict[str, Any]:
 
 
 @router.get("/")
+@cached_response("talent")
 def list_talent(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
     discipline: str | None = None,
     affiliation: str | None = None,
     min_score: float | None = None,
     max_score: float | None = None,
+    theme: str | None = None,
+    location: str | None = None,
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
-    query = db.query(Talent)
+    stmt = select(*_TALENT_COLS)
 
     if discipline:
-        query = query.filter(Talent.discipline == discipline)
+        stmt = stmt.where(Talent.discipline == discipline)
     if min_score is not None:
-        query = query.filter(Talent.score >= min_score)
+        stmt = stmt.where(Talent.score >= min_score)
     if max_score is not None:
-        query = query.filter(Talent.score <= max_score)
+        stmt = stmt.where(Talent.score <= max_score)
+    if theme:
+        stmt = stmt.where(_tag_filter(Talent.themes, theme))
+    if location:
+        stmt = stmt.where(_tag_filter(Talent.location_tags, location))
     if affiliation:
-        query = (
-            query.join(TalentOrg).join(Org).filter(Org.name.ilike(f"%{affiliation}%")).distinct()
+        # EXISTS stops at the first matching org and never duplicates talent
+        # rows, so no DISTINCT is needed and the windowed total stays exact.
+        stmt = stmt.where(
+            exists()
+            .where(TalentOrg.talent_id == Talent.id)
+            .where(Org.id == TalentOrg.org_id)
+            .where(Org.name.ilike(f"%{affiliation}%"))
         )
 
-    total = query.count()
-    talents = (
-        query.order_by(Talent.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+    etag, matched = list_etag(db, stmt, Talent.updated_at, request)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["X-Total-Count"] = str(matched)
+
+    talents, total = paginate(
+        db, stmt.order_by(Talent.created_at.desc()), page, page_size, scalars=False, total=matched
     )
 
     return {
@@ -86,26 +140,28 @@ def create_talent(payload: dict[str, Any], db: Session = Depends(get_db)) -> dic
     if not name:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="name is required")
 
-    talent = Talent(
-        name=name,
-        discipline=payload.get("discipline"),
-        subdiscipline=payload.get("subdiscipline"),
-        primary_handle_url=payload.get("primary_handle_url"),
-        other_links=payload.get("other_links") or [],
-        contact_public=payload.get("contact_public", False),
-        contact_email=payload.get("contact_email"),
-        phone=payload.get("phone"),
-        location_tags=payload.get("location_tags"),
-        themes=payload.get("themes"),
-        notes=payload.get("notes"),
-        score=payload.get("score"),
-        score_json=payload.get("score_json") or {},
-    )
-
-    db.add(talent)
+    row = db.execute(
+        insert(Talent)
+        .values(
+            name=name,
+            discipline=payload.get("discipline"),
+            subdiscipline=payload.get("subdiscipline"),
+            primary_handle_url=payload.get("primary_handle_url"),
+            other_links=payload.get("other_links") or [],
+            contact_public=payload.get("contact_public", False),
+            contact_email=payload.get("contact_email"),
+            phone=payload.get("phone"),
+            location_tags=payload.get("location_tags"),
+            themes=payload.get("themes"),
+            notes=payload.get("notes"),
+            score=payload.get("score"),
+            score_json=payload.get("score_json") or {},
+        )
+        .returning(*_TALENT_COLS)
+    ).one()
     db.commit()
-    db.refresh(talent)
-    return _serialize_talent(talent)
+    invalidate("talent")
+    return _serialize_talent(row)
 
 
 @router.get("/{talent_id}")
@@ -118,10 +174,7 @@ def get_talent(talent_id: int, db: Session = Depends(get_db)) -> dict[str, Any]:
 
 @router.put("/{talent_id}")
 def update_talent(talent_id: int, payload: dict[str, Any], db: Session = Depends(get_db)) -> dict[str, Any]:
-    talent = db.get(Talent, talent_id)
-    if talent is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Talent not found")
-
+    values: dict[str, Any] = {}
     for field in (
         "name",
         "discipline",
@@ -141,12 +194,20 @@ def update_talent(talent_id: int, payload: dict[str, Any], db: Session = Depends
             value = payload[field]
             if field in {"other_links", "score_json"} and value is None:
                 value = [] if field == "other_links" else {}
-            setattr(talent, field, value)
+            values[field] = value
+
+    if not values:
+        return get_talent(talent_id, db)
+
+    row = db.execute(
+        update(Talent).where(Talent.id == talent_id).values(**values).returning(*_TALENT_COLS)
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Talent not found")
 
-    db.add(talent)
     db.commit()
-    db.refresh(talent)
-    return _serialize_talent(talent)
+    invalidate("talent")
+    return _serialize_talent(row)
 
 
 @router.delete("/{talent_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
@@ -157,4 +218,5 @@ def delete_talent(talent_id: int, db: Session = Depends(get_db)) -> Response:
 
     db.delete(talent)
     db.commit()
+    invalidate("talent")
     return Response(status_code=status.HTTP_204_NO_CONTENT)
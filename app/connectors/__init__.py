@@ -1,11 +1,28 @@
-"""Connector package."""
+"""Connector package.
 
-from . import caha_pdf, reddit, events, instagram, tiktok
+Connector modules register themselves with ``connectors.base.registry`` on
+import. They pull in heavy parsing dependencies, so they are only imported
+on demand via :func:`load_connectors` (by the scheduler and worker) rather
+than whenever the package is touched.
+"""
 
-__all__ = [
+from __future__ import annotations
+
+import importlib
+
+CONNECTOR_MODULES = (
     "caha_pdf",
     "reddit",
     "events",
     "instagram",
     "tiktok",
-]
+)
+
+
+def load_connectors() -> None:
+    """Import every connector module so the registry is fully populated."""
+    for module_name in CONNECTOR_MODULES:
+        importlib.import_module(f"{__name__}.{module_name}")
+
+
+__all__ = ["CONNECTOR_MODULES", "load_connectors"]
@@ -0,0 +1,32 @@
+"""Handle and hashtag scanning shared by the social connectors."""
+
+from __future__ import annotations
+
+import re
+
+
+# Handles and hashtags share one alternation so each caption is scanned once.
+# Neither character class admits "@" or "#", so matches never overlap.
+MENTION_PATTERN = re.compile(
+    r"@(?P<handle>[\w.\u00C0-\u024F]{2,64})|#(?P<hashtag>[\w.\u00C0-\u024F]+)",
+    flags=re.UNICODE,
+)
+_iter_mentions = MENTION_PATTERN.finditer
+
+
+def scan_mentions(text: str) -> tuple[list[str], list[str]]:
+    """Split ``text`` into its handles and hashtags, without their sigils."""
+    handles: list[str] = []
+    hashtags: list[str] = []
+    for match in _iter_mentions(text):
+        if match.lastgroup == "handle":
+            handles.append(match.group("handle"))
+        else:
+            hashtags.append(match.group("hashtag"))
+    return handles, hashtags
+
+
+def hashtag_themes(hashtags: list[str]) -> list[str]:
+    """Lower-cased themes from normalised ``#tag`` strings."""
+    # Normalised tags carry exactly one leading "#", so slice it off.
+    return [tag[1:].lower() for tag in hashtags]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Protocol, Sequence
+from typing import Iterable, Protocol, Sequence
 
 from pydantic import BaseModel, Field
 
@@ -30,7 +30,8 @@ class Connector(Protocol):
     name: str
     default_cadence: str
 
-    def fetch(self, since: datetime | None) -> Sequence[SourcePayload]:
+    def fetch(self, since: datetime | None) -> Iterable[SourcePayload]:
+        """Return the sources to ingest; may be a generator for large fetches."""
         ...
 
     def extract(self, source: SourcePayload) -> Sequence[Candidate]:
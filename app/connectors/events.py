@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Sequence
 
 from connectors.base import Candidate, Connector, SourcePayload, registry
@@ -12,15 +13,24 @@ class EventsConnector:
     name = "events"
     default_cadence = "0 5 * * 1"  # weekly Monday
 
+    def __init__(self, listing_path: Path | None = None) -> None:
+        self.listing_path = listing_path or Path("connectors/fixtures/events_sample.html")
+
     def fetch(self, since: datetime | None) -> Sequence[SourcePayload]:
         fetched_at = datetime.now(timezone.utc)
+        # Lets run_connector skip re-extracting a listing it has already stored.
+        try:
+            content_hash: str | None = f"events:{int(self.listing_path.stat().st_mtime)}"
+        except FileNotFoundError:
+            content_hash = None
         return [
             SourcePayload(
                 channel=self.name,
                 url="https://www.guamtime.net",
                 kind="html",
                 fetched_at=fetched_at,
-                raw_blob_ptr="connectors/fixtures/events_sample.html",
+                raw_blob_ptr=str(self.listing_path),
+                content_hash=content_hash,
                 meta={
                     "cadence": "weekly",
                     "channels": ["GuamTime", "The Guam Guide", "Visit Guam", "Festival rosters"],
@@ -34,26 +44,27 @@ class EventsConnector:
         if not path:
             return candidates
         try:
-            with open(path, "r", encoding="utf-8") as fp:
-                content = fp.readlines()
+            fp = open(path, "r", encoding="utf-8")
         except FileNotFoundError:
             return candidates
 
-        for line in content:
-            line = line.strip()
-            if not line:
-                continue
-            candidates.append(
-                Candidate(
-                    name=line,
-                    evidence=line,
-                    channel=self.name,
-                    metadata={
-                        "source": source.url,
-                        "event_signal": True,
-                    },
+        # Iterate the file lazily rather than materialising every line first.
+        with fp:
+            for line in fp:
+                line = line.strip()
+                if not line:
+                    continue
+                candidates.append(
+                    Candidate(
+                        name=line,
+                        evidence=line,
+                        channel=self.name,
+                        metadata={
+                            "source": source.url,
+                            "event_signal": True,
+                        },
+                    )
                 )
-            )
         return candidates
 
 
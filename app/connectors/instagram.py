@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
-import json
-import re
+import functools
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Sequence
 
+import orjson
+
+from connectors._mentions import hashtag_themes, scan_mentions
 from connectors.base import Candidate, SourcePayload, registry
 
 
-HANDLE_PATTERN = re.compile(r"@([\w.\u00C0-\u024F]{2,64})", flags=re.UNICODE)
-HASHTAG_PATTERN = re.compile(r"#([\w.\u00C0-\u024F]+)", flags=re.UNICODE)
+@functools.lru_cache(maxsize=8192)
+def _normalize_timestamp(raw: str) -> str | None:
+    # Posts in a page often share timestamps; parse each distinct value once.
+    try:
+        return datetime.fromisoformat(raw.replace("Z", "+00:00")).astimezone(timezone.utc).isoformat()
+    except ValueError:
+        return None
 
 
 class InstagramConnector:
@@ -52,9 +59,8 @@ class InstagramConnector:
             return []
 
         try:
-            with payload_path.open("r", encoding="utf-8") as fp:
-                payload: dict[str, Any] = json.load(fp)
-        except (OSError, json.JSONDecodeError):
+            payload: dict[str, Any] = orjson.loads(payload_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
             return []
 
         posts = payload.get("data", [])
@@ -73,21 +79,11 @@ class InstagramConnector:
         post_id = post.get("id") or permalink or "instagram-post"
 
         timestamp_raw = post.get("timestamp")
-        timestamp_iso: str | None
-        if isinstance(timestamp_raw, str):
-            try:
-                timestamp_iso = (
-                    datetime.fromisoformat(timestamp_raw.replace("Z", "+00:00"))
-                    .astimezone(timezone.utc)
-                    .isoformat()
-                )
-            except ValueError:
-                timestamp_iso = None
-        else:
-            timestamp_iso = None
-
-        handles = self._normalize_handles(self._extract_handles(caption))
-        hashtags = self._normalize_hashtags(self._extract_hashtags(caption))
+        timestamp_iso = _normalize_timestamp(timestamp_raw) if isinstance(timestamp_raw, str) else None
+
+        raw_handles, raw_hashtags = scan_mentions(caption)
+        handles = self._normalize_handles(raw_handles)
+        hashtags = self._normalize_hashtags(raw_hashtags)
 
         location = post.get("location")
         geotags: list[dict[str, Any]] = []
@@ -113,7 +109,7 @@ class InstagramConnector:
             "geotags": geotags,
             "handles": handles,
             "hashtags": hashtags,
-            "themes": [tag.lstrip("#").lower() for tag in hashtags],
+            "themes": hashtag_themes(hashtags),
             "seed_account": post.get("username"),
             "media_type": post.get("media_type"),
             "raw_payload_ptr": source.raw_blob_ptr or str(self._FIXTURE_PATH),
@@ -128,35 +124,14 @@ class InstagramConnector:
             metadata=metadata,
         )
 
-    @staticmethod
-    def _extract_handles(text: str) -> list[str]:
-        return HANDLE_PATTERN.findall(text)
-
-    @staticmethod
-    def _extract_hashtags(text: str) -> list[str]:
-        return HASHTAG_PATTERN.findall(text)
-
     @staticmethod
     def _normalize_handles(handles: list[str]) -> list[str]:
-        seen: set[str] = set()
-        ordered: list[str] = []
-        for handle in handles:
-            formatted = f"@{handle.lstrip('@')}"
-            if formatted not in seen:
-                seen.add(formatted)
-                ordered.append(formatted)
-        return ordered
+        # scan_mentions captures exclude the sigil, so there is nothing to strip.
+        return list(dict.fromkeys(f"@{handle}" for handle in handles))
 
     @staticmethod
     def _normalize_hashtags(hashtags: list[str]) -> list[str]:
-        seen: set[str] = set()
-        ordered: list[str] = []
-        for tag in hashtags:
-            formatted = f"#{tag.lstrip('#')}"
-            if formatted not in seen:
-                seen.add(formatted)
-                ordered.append(formatted)
-        return ordered
+        return list(dict.fromkeys(f"#{tag}" for tag in hashtags))
 
 
 registry.register(InstagramConnector())
@@ -4,28 +4,39 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Sequence
 
 from connectors.base import Candidate, Connector, SourcePayload, registry
 
 
 HANDLE_REGEX = re.compile(r"@([A-Za-z0-9_.]{2,30})")
-URL_REGEX = re.compile(r"(https?://\S+)")
+# One pass finds both handles and URLs; dispatch on the group that matched.
+MENTION_REGEX = re.compile(r"@(?P<handle>[A-Za-z0-9_.]{2,30})|(?P<url>https?://\S+)")
 
 
 class RedditConnector:
     name = "reddit"
     default_cadence = "0 6 * * *"  # daily morning
 
+    def __init__(self, thread_path: Path | None = None) -> None:
+        self.thread_path = thread_path or Path("connectors/fixtures/reddit_sample.html")
+
     def fetch(self, since: datetime | None) -> Sequence[SourcePayload]:
         fetched_at = datetime.now(timezone.utc)
+        # Lets run_connector skip re-extracting a thread it has already stored.
+        try:
+            content_hash: str | None = f"reddit:{int(self.thread_path.stat().st_mtime)}"
+        except FileNotFoundError:
+            content_hash = None
         return [
             SourcePayload(
                 channel=self.name,
                 url="https://www.reddit.com/r/guam",
                 kind="html",
                 fetched_at=fetched_at,
-                raw_blob_ptr="connectors/fixtures/reddit_sample.html",
+                raw_blob_ptr=str(self.thread_path),
+                content_hash=content_hash,
                 meta={
                     "community_signal": "reddit",
                     "saved_searches": [
@@ -51,34 +62,47 @@ class RedditConnector:
         except FileNotFoundError:
             return candidates
 
-        handles = HANDLE_REGEX.findall(content)
-        urls = URL_REGEX.findall(content)
-        for handle in handles:
-            candidates.append(
-                Candidate(
-                    name=f"@{handle}",
-                    evidence=f"Mentioned in Reddit thread: @{handle}",
-                    channel=self.name,
-                    metadata={
-                        "handle": handle,
-                        "source": source.url,
-                        "community_signal": "reddit",
-                    },
-                )
+        handles: list[str] = []
+        urls: list[str] = []
+        for match in MENTION_REGEX.finditer(content):
+            if match.lastgroup == "handle":
+                handles.append(match.group("handle"))
+                continue
+            url = match.group("url")
+            urls.append(url)
+            # Profile links such as tiktok.com/@name still count as mentions.
+            if "@" in url:
+                handles.extend(HANDLE_REGEX.findall(url))
+
+        # Shared by every candidate from this payload; resolve them once.
+        source_url = source.url
+        channel = self.name
+        candidates.extend(
+            Candidate(
+                name=f"@{handle}",
+                evidence=f"Mentioned in Reddit thread: @{handle}",
+                channel=channel,
+                metadata={
+                    "handle": handle,
+                    "source": source_url,
+                    "community_signal": "reddit",
+                },
             )
-        for url in urls:
-            candidates.append(
-                Candidate(
-                    name=url,
-                    evidence=f"URL shared on Reddit: {url}",
-                    channel=self.name,
-                    metadata={
-                        "url": url,
-                        "source": source.url,
-                        "community_signal": "reddit",
-                    },
-                )
+            for handle in handles
+        )
+        candidates.extend(
+            Candidate(
+                name=url,
+                evidence=f"URL shared on Reddit: {url}",
+                channel=channel,
+                metadata={
+                    "url": url,
+                    "source": source_url,
+                    "community_signal": "reddit",
+                },
             )
+            for url in urls
+        )
 
         return candidates
 
@@ -2,17 +2,14 @@
 
 from __future__ import annotations
 
-import json
-import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Sequence
 
-from connectors.base import Candidate, SourcePayload, registry
-
+import orjson
 
-HANDLE_PATTERN = re.compile(r"@([\w.\u00C0-\u024F]{2,64})", flags=re.UNICODE)
-HASHTAG_PATTERN = re.compile(r"#([\w.\u00C0-\u024F]+)", flags=re.UNICODE)
+from connectors._mentions import hashtag_themes, scan_mentions
+from connectors.base import Candidate, SourcePayload, registry
 
 
 class TikTokConnector:
@@ -52,9 +49,8 @@ class TikTokConnector:
             return []
 
         try:
-            with payload_path.open("r", encoding="utf-8") as fp:
-                payload: dict[str, Any] = json.load(fp)
-        except (OSError, json.JSONDecodeError):
+            payload: dict[str, Any] = orjson.loads(payload_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
             return []
 
         videos = payload.get("aweme_list", [])
@@ -73,8 +69,9 @@ class TikTokConnector:
         if isinstance(create_time, (int, float)):
             timestamp_iso = datetime.fromtimestamp(create_time, tz=timezone.utc).isoformat()
 
-        handles = self._normalize_handles(self._collect_handles(video, description))
-        hashtags = self._normalize_hashtags(self._collect_hashtags(video, description))
+        caption_handles, caption_hashtags = scan_mentions(description)
+        handles = self._normalize_handles(self._collect_handles(video, caption_handles))
+        hashtags = self._normalize_hashtags(self._collect_hashtags(video, caption_hashtags))
 
         statistics = video.get("statistics") or {}
         engagement = {
@@ -104,7 +101,7 @@ class TikTokConnector:
             "geotags": geotags,
             "handles": handles,
             "hashtags": hashtags,
-            "themes": [tag.lstrip("#").lower() for tag in hashtags],
+            "themes": hashtag_themes(hashtags),
             "seed_handle": video.get("author", {}).get("unique_id"),
             "raw_payload_ptr": source.raw_blob_ptr or str(self._FIXTURE_PATH),
         }
@@ -118,8 +115,7 @@ class TikTokConnector:
             metadata=metadata,
         )
 
-    def _collect_handles(self, video: dict[str, Any], description: str) -> list[str]:
-        handles = HANDLE_PATTERN.findall(description)
+    def _collect_handles(self, video: dict[str, Any], handles: list[str]) -> list[str]:
         text_extra = video.get("text_extra")
         if isinstance(text_extra, list):
             for item in text_extra:
@@ -133,8 +129,7 @@ class TikTokConnector:
                 handles.append(author_id)
         return handles
 
-    def _collect_hashtags(self, video: dict[str, Any], description: str) -> list[str]:
-        hashtags = HASHTAG_PATTERN.findall(description)
+    def _collect_hashtags(self, video: dict[str, Any], hashtags: list[str]) -> list[str]:
         text_extra = video.get("text_extra")
         if isinstance(text_extra, list):
             for item in text_extra:
@@ -145,25 +140,12 @@ class TikTokConnector:
 
     @staticmethod
     def _normalize_handles(handles: list[str]) -> list[str]:
-        seen: set[str] = set()
-        ordered: list[str] = []
-        for handle in handles:
-            formatted = f"@{str(handle).lstrip('@')}"
-            if formatted not in seen:
-                seen.add(formatted)
-                ordered.append(formatted)
-        return ordered
+        # dict.fromkeys dedupes in first-seen order with one hash op per item.
+        return list(dict.fromkeys(f"@{str(handle).lstrip('@')}" for handle in handles))
 
     @staticmethod
     def _normalize_hashtags(hashtags: list[str]) -> list[str]:
-        seen: set[str] = set()
-        ordered: list[str] = []
-        for tag in hashtags:
-            formatted = f"#{str(tag).lstrip('#')}"
-            if formatted not in seen:
-                seen.add(formatted)
-                ordered.append(formatted)
-        return ordered
+        return list(dict.fromkeys(f"#{str(tag).lstrip('#')}" for tag in hashtags))
 
 
 registry.register(TikTokConnector())
@@ -1,8 +1,11 @@
 """SQLAlchemy models and session utilities."""
 
 from .base import Base
+from .bulk import bulk_insert, insert_if_absent
 from .session import SessionLocal, engine, get_session
 from .tables import (
+    CANDIDATE_STATUSES,
+    RUN_STATUSES,
     Candidate,
     Embedding,
     Event,
@@ -18,6 +21,8 @@ from .tables import (
 
 __all__ = [
     "Base",
+    "bulk_insert",
+    "insert_if_absent",
     "SessionLocal",
     "engine",
     "get_session",
@@ -32,5 +37,7 @@ __all__ = [
     "Talent",
     "TalentEvent",
     "TalentOrg",
+    "CANDIDATE_STATUSES",
+    "RUN_STATUSES",
 ]
 
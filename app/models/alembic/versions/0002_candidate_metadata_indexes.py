@@ -0,0 +1,35 @@
+"""Index candidate metadata keys used by the list filters.
+
+Revision ID: 0002_candidate_metadata_indexes
+Revises: 0001_initial_schema
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002_candidate_metadata_indexes"
+down_revision = "0001_initial_schema"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_candidate_metadata_discipline",
+        "candidate",
+        [sa.text("(metadata ->> 'discipline')")],
+    )
+    op.create_index(
+        "ix_candidate_metadata_affiliation",
+        "candidate",
+        [sa.text("(metadata ->> 'affiliation')")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_candidate_metadata_affiliation", table_name="candidate")
+    op.drop_index("ix_candidate_metadata_discipline", table_name="candidate")
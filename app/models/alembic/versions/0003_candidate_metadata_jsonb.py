@@ -0,0 +1,63 @@
+"""Store candidate metadata as JSONB behind a GIN index.
+
+Revision ID: 0003_candidate_metadata_jsonb
+Revises: 0002_candidate_metadata_indexes
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0003_candidate_metadata_jsonb"
+down_revision = "0002_candidate_metadata_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Containment queries on the GIN index cover both list filters, so the
+    # per-key expression indexes are no longer used.
+    op.drop_index("ix_candidate_metadata_affiliation", table_name="candidate")
+    op.drop_index("ix_candidate_metadata_discipline", table_name="candidate")
+
+    op.alter_column("candidate", "metadata", server_default=None)
+    op.alter_column(
+        "candidate",
+        "metadata",
+        type_=postgresql.JSONB(),
+        postgresql_using="metadata::jsonb",
+        server_default=sa.text("'{}'::jsonb"),
+    )
+    op.create_index(
+        "ix_candidate_metadata_gin",
+        "candidate",
+        ["metadata"],
+        postgresql_using="gin",
+        postgresql_ops={"metadata": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_candidate_metadata_gin", table_name="candidate")
+    op.alter_column("candidate", "metadata", server_default=None)
+    op.alter_column(
+        "candidate",
+        "metadata",
+        type_=sa.JSON(),
+        postgresql_using="metadata::json",
+        server_default=sa.text("'{}'::json"),
+    )
+    op.create_index(
+        "ix_candidate_metadata_discipline",
+        "candidate",
+        [sa.text("(metadata ->> 'discipline')")],
+    )
+    op.create_index(
+        "ix_candidate_metadata_affiliation",
+        "candidate",
+        [sa.text("(metadata ->> 'affiliation')")],
+    )
@@ -0,0 +1,31 @@
+"""Trigram index for substring searches on org names.
+
+Revision ID: 0004_org_name_trgm
+Revises: 0003_candidate_metadata_jsonb
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0004_org_name_trgm"
+down_revision = "0003_candidate_metadata_jsonb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_org_name_trgm",
+        "org",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_org_name_trgm", table_name="org")
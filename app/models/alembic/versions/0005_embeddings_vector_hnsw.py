@@ -0,0 +1,33 @@
+"""HNSW index for cosine similarity search on embeddings.
+
+Revision ID: 0005_embeddings_vector_hnsw
+Revises: 0004_org_name_trgm
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0005_embeddings_vector_hnsw"
+down_revision = "0004_org_name_trgm"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # HNSW builds are much faster when the graph fits in maintenance memory.
+    op.execute("SET LOCAL maintenance_work_mem = '512MB'")
+    op.create_index(
+        "ix_embeddings_vector_hnsw",
+        "embeddings",
+        ["vector"],
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"vector": "vector_cosine_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_embeddings_vector_hnsw", table_name="embeddings")
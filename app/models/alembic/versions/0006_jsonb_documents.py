@@ -0,0 +1,49 @@
+"""Store the remaining JSON document columns as JSONB.
+
+Revision ID: 0006_jsonb_documents
+Revises: 0005_embeddings_vector_hnsw
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0006_jsonb_documents"
+down_revision = "0005_embeddings_vector_hnsw"
+branch_labels = None
+depends_on = None
+
+# (table, column, empty document literal)
+_COLUMNS = (
+    ("source", "meta", "{}"),
+    ("talent", "other_links", "[]"),
+    ("talent", "score_json", "{}"),
+)
+
+
+def upgrade() -> None:
+    for table, column, empty in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+            server_default=sa.text(f"'{empty}'::jsonb"),
+        )
+
+
+def downgrade() -> None:
+    for table, column, empty in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+            server_default=sa.text(f"'{empty}'::json"),
+        )
@@ -0,0 +1,38 @@
+"""B-tree indexes for list filters, orderings and foreign keys.
+
+Revision ID: 0007_filter_indexes
+Revises: 0006_jsonb_documents
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0007_filter_indexes"
+down_revision = "0006_jsonb_documents"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+_INDEXES = (
+    ("ix_source_channel_fetched_at", "source", ["channel", "fetched_at"]),
+    ("ix_source_fetched_at", "source", ["fetched_at"]),
+    ("ix_candidate_source_id", "candidate", ["source_id"]),
+    ("ix_candidate_status_created_at", "candidate", ["status", "created_at"]),
+    ("ix_candidate_created_at", "candidate", ["created_at"]),
+    ("ix_mention_talent_id", "mention", ["talent_id"]),
+    ("ix_mention_source_id", "mention", ["source_id"]),
+    ("ix_runs_started_at", "runs", ["started_at"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,37 @@
+"""Store candidate and talent scores as double precision.
+
+Revision ID: 0008_float_scores
+Revises: 0007_filter_indexes
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008_float_scores"
+down_revision = "0007_filter_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ("candidate", "talent"):
+        op.alter_column(
+            table,
+            "score",
+            type_=sa.Float(),
+            postgresql_using="score::double precision",
+        )
+
+
+def downgrade() -> None:
+    for table in ("candidate", "talent"):
+        op.alter_column(
+            table,
+            "score",
+            type_=sa.Numeric(),
+            postgresql_using="score::numeric",
+        )
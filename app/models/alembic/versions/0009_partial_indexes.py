@@ -0,0 +1,37 @@
+"""Partial indexes for the pending review queue and enabled schedules.
+
+Revision ID: 0009_partial_indexes
+Revises: 0008_float_scores
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0009_partial_indexes"
+down_revision = "0008_float_scores"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_candidate_pending",
+        "candidate",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_schedules_due",
+        "schedules",
+        ["next_due_at"],
+        postgresql_where=sa.text("enabled"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedules_due", table_name="schedules")
+    op.drop_index("ix_candidate_pending", table_name="candidate")
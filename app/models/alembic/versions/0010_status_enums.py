@@ -0,0 +1,79 @@
+"""Native enum types for candidate and run statuses.
+
+Revision ID: 0010_status_enums
+Revises: 0009_partial_indexes
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0010_status_enums"
+down_revision = "0009_partial_indexes"
+branch_labels = None
+depends_on = None
+
+_CANDIDATE_STATUS = sa.Enum("pending", "approved", "watch", "dismissed", name="candidate_status")
+_RUN_STATUS = sa.Enum("queued", "running", "success", "error", name="run_status")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    _CANDIDATE_STATUS.create(bind, checkfirst=True)
+    _RUN_STATUS.create(bind, checkfirst=True)
+
+    # The text default and the partial index predicate (status = 'pending'
+    # as text) cannot be re-parsed against the enum, so swap both around the
+    # type change.
+    op.drop_index("ix_candidate_pending", table_name="candidate")
+    op.alter_column("candidate", "status", server_default=None)
+    op.alter_column(
+        "candidate",
+        "status",
+        type_=_CANDIDATE_STATUS,
+        postgresql_using="status::candidate_status",
+    )
+    op.alter_column(
+        "candidate",
+        "status",
+        server_default=sa.text("'pending'::candidate_status"),
+    )
+    op.create_index(
+        "ix_candidate_pending",
+        "candidate",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'pending'::candidate_status"),
+    )
+
+    op.drop_constraint("runs_status_check", "runs", type_="check")
+    op.alter_column(
+        "runs",
+        "status",
+        type_=_RUN_STATUS,
+        postgresql_using="status::run_status",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column("runs", "status", type_=sa.Text(), postgresql_using="status::text")
+    op.create_check_constraint(
+        "runs_status_check", "runs", "status IN ('queued','running','success','error')"
+    )
+
+    op.drop_index("ix_candidate_pending", table_name="candidate")
+    op.alter_column("candidate", "status", server_default=None)
+    op.alter_column("candidate", "status", type_=sa.Text(), postgresql_using="status::text")
+    op.alter_column("candidate", "status", server_default="pending")
+    op.create_index(
+        "ix_candidate_pending",
+        "candidate",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+    bind = op.get_bind()
+    _RUN_STATUS.drop(bind, checkfirst=True)
+    _CANDIDATE_STATUS.drop(bind, checkfirst=True)
@@ -0,0 +1,26 @@
+"""GIN indexes for talent theme and location tag filters.
+
+Revision ID: 0011_talent_tag_gin
+Revises: 0010_status_enums
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0011_talent_tag_gin"
+down_revision = "0010_status_enums"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_talent_themes_gin", "talent", ["themes"], postgresql_using="gin")
+    op.create_index("ix_talent_location_tags_gin", "talent", ["location_tags"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_talent_location_tags_gin", table_name="talent")
+    op.drop_index("ix_talent_themes_gin", table_name="talent")
@@ -0,0 +1,27 @@
+"""Default updated_at to clock_timestamp() instead of now().
+
+Revision ID: 0012_updated_at_clock_timestamp
+Revises: 0011_talent_tag_gin
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0012_updated_at_clock_timestamp"
+down_revision = "0011_talent_tag_gin"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ("candidate", "talent"):
+        op.alter_column(table, "updated_at", server_default=sa.text("clock_timestamp()"))
+
+
+def downgrade() -> None:
+    for table in ("candidate", "talent"):
+        op.alter_column(table, "updated_at", server_default=sa.text("now()"))
@@ -0,0 +1,59 @@
+"""Bulk write helpers for ingestion paths."""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .base import Base
+
+
+def bulk_insert(
+    session: Session,
+    model: type[Base],
+    rows: Sequence[dict[str, Any]],
+    chunk_size: int = 5000,
+) -> int:
+    """Insert ``rows`` (keyed by ORM attribute name) and return how many were written.
+
+    Each chunk is sent as a single executemany, which SQLAlchemy batches into
+    multi-row ``INSERT ... VALUES`` statements, instead of flushing one ORM
+    object per row. Python-side column defaults still apply; no objects are
+    added to the session's identity map.
+    """
+
+    stmt = insert(model)
+    for start in range(0, len(rows), chunk_size):
+        session.execute(stmt, rows[start : start + chunk_size])
+    return len(rows)
+
+
+_DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def insert_if_absent(
+    session: Session,
+    model: type[Base],
+    values: dict[str, Any],
+    conflict_column: str,
+) -> Any | None:
+    """Insert one row unless ``conflict_column`` already holds its value.
+
+    Returns the new row's ``id``, or ``None`` when a row with the same unique
+    value exists. The existence check and the insert are one
+    ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` round trip rather than a
+    SELECT followed by an INSERT, and concurrent workers cannot race between
+    the two.
+    """
+
+    dialect_insert = _DIALECT_INSERTS[session.get_bind().dialect.name]
+    stmt = (
+        dialect_insert(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=[conflict_column])
+        .returning(model.id)
+    )
+    return session.scalar(stmt)
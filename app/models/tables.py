@@ -8,19 +8,24 @@ from typing import Any
 from sqlalchemy import (
     JSON,
     Boolean,
-    CheckConstraint,
     Column,
     Date,
     DateTime,
+    Enum,
+    Float,
     ForeignKey,
+    Index,
     Integer,
-    Numeric,
     PrimaryKeyConstraint,
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import functions
 from pgvector.sqlalchemy import Vector
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import TypeDecorator
@@ -28,6 +33,31 @@ from sqlalchemy.types import TypeDecorator
 from .base import Base
 
 
+CANDIDATE_STATUSES = ("pending", "approved", "watch", "dismissed")
+RUN_STATUSES = ("queued", "running", "success", "error")
+
+
+class clock_timestamp(functions.GenericFunction[datetime]):
+    """Postgres ``clock_timestamp()``: unlike ``now()``, which is frozen at the
+    start of the transaction, it advances within one, so an ``updated_at``
+    written late in a long transaction still sorts after earlier commits."""
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(functions.now, "sqlite")
+@compiles(clock_timestamp, "sqlite")
+def _sqlite_now(element, compiler, **kw):  # type: ignore[no-untyped-def]
+    # CURRENT_TIMESTAMP only has second resolution on SQLite, which is too
+    # coarse for updated_at-based ETags; Postgres is microsecond-precise.
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'NOW')"
+
+
+# JSONB on Postgres (indexable, no per-row re-parse); plain JSON elsewhere.
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
 class StringList(TypeDecorator):
     """Stores lists of strings across SQLite and Postgres."""
 
@@ -50,11 +80,17 @@ class Source(Base):
     fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     content_hash: Mapped[str | None] = mapped_column(String, unique=True)
     raw_blob_ptr: Mapped[str | None] = mapped_column(String)
-    meta: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
+    meta: Mapped[dict[str, Any]] = mapped_column(JSONDocument, default=dict)
 
     mentions: Mapped[list["Mention"]] = relationship(back_populates="source", cascade="all, delete-orphan")
     candidates: Mapped[list["Candidate"]] = relationship("Candidate", back_populates="source", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Serves the logs list: optional channel filter, newest first.
+        Index("ix_source_channel_fetched_at", "channel", "fetched_at"),
+        Index("ix_source_fetched_at", "fetched_at"),
+    )
+
 
 class Candidate(Base):
     __tablename__ = "candidate"
@@ -64,14 +100,39 @@ class Candidate(Base):
     name: Mapped[str] = mapped_column(String, nullable=False)
     channel: Mapped[str] = mapped_column(String, nullable=False)
     evidence: Mapped[str | None] = mapped_column(Text)
-    metadata_json: Mapped[dict[str, Any]] = mapped_column("metadata", JSON, default=dict)
-    status: Mapped[str] = mapped_column(String, default="pending")
-    score: Mapped[float | None] = mapped_column(Numeric)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    metadata_json: Mapped[dict[str, Any]] = mapped_column("metadata", JSONDocument, default=dict)
+    status: Mapped[str] = mapped_column(
+        Enum(*CANDIDATE_STATUSES, name="candidate_status", create_constraint=True), default="pending"
+    )
+    score: Mapped[float | None] = mapped_column(Float)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.clock_timestamp(), onupdate=func.clock_timestamp()
+    )
 
     source: Mapped["Source"] = relationship("Source", back_populates="candidates")
 
+    __table_args__ = (
+        Index("ix_candidate_source_id", "source_id"),
+        # Status filter plus the newest-first ordering of list_candidates.
+        Index("ix_candidate_status_created_at", "status", "created_at"),
+        Index("ix_candidate_created_at", "created_at"),
+        # The review queue only ever pages through pending rows; keeping
+        # resolved candidates out of it keeps the index small and hot.
+        Index(
+            "ix_candidate_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'::candidate_status"),
+        ).ddl_if(dialect="postgresql"),
+        # Serves the containment (@>) metadata filters used by list_candidates.
+        Index(
+            "ix_candidate_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
 
 class Talent(Base):
     __tablename__ = "talent"
@@ -81,23 +142,33 @@ class Talent(Base):
     discipline: Mapped[str | None] = mapped_column(String)
     subdiscipline: Mapped[str | None] = mapped_column(String)
     primary_handle_url: Mapped[str | None] = mapped_column(String)
-    other_links: Mapped[list[str]] = mapped_column(JSON, default=list)
+    other_links: Mapped[list[str]] = mapped_column(JSONDocument, default=list)
     contact_public: Mapped[bool] = mapped_column(Boolean, default=False)
     contact_email: Mapped[str | None] = mapped_column(String)
     phone: Mapped[str | None] = mapped_column(String)
     location_tags: Mapped[list[str] | None] = mapped_column(StringList())
     themes: Mapped[list[str] | None] = mapped_column(StringList())
     notes: Mapped[str | None] = mapped_column(Text)
-    score: Mapped[float | None] = mapped_column(Numeric)
-    score_json: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    score: Mapped[float | None] = mapped_column(Float)
+    score_json: Mapped[dict[str, Any]] = mapped_column(JSONDocument, default=dict)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.clock_timestamp(), onupdate=func.clock_timestamp()
+    )
 
     mentions: Mapped[list["Mention"]] = relationship(back_populates="talent", cascade="all, delete-orphan")
     orgs: Mapped[list["TalentOrg"]] = relationship(back_populates="talent", cascade="all, delete-orphan")
     events: Mapped[list["TalentEvent"]] = relationship(back_populates="talent", cascade="all, delete-orphan")
     sources: Mapped[list["Source"]] = relationship("Source", secondary="mention", viewonly=True)
 
+    __table_args__ = (
+        # Serve the array containment (@>) filters on the talent list.
+        Index("ix_talent_themes_gin", "themes", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        Index("ix_talent_location_tags_gin", "location_tags", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
+
 
 class Org(Base):
     __tablename__ = "org"
@@ -109,6 +180,16 @@ class Org(Base):
 
     talents: Mapped[list["TalentOrg"]] = relationship(back_populates="org", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Trigram index so the talent affiliation ILIKE '%...%' filter can avoid a seq scan.
+        Index(
+            "ix_org_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
 
 class Event(Base):
     __tablename__ = "event"
@@ -137,6 +218,11 @@ class Mention(Base):
     talent: Mapped[Talent | None] = relationship("Talent", back_populates="mentions")
     source: Mapped[Source | None] = relationship("Source", back_populates="mentions")
 
+    __table_args__ = (
+        Index("ix_mention_talent_id", "talent_id"),
+        Index("ix_mention_source_id", "source_id"),
+    )
+
 
 class TalentOrg(Base):
     __tablename__ = "talent_org"
@@ -163,12 +249,29 @@ class TalentEvent(Base):
 
 
 class Embedding(Base):
+    """Vector embeddings keyed by (object_type, object_id).
+
+    Similarity queries must order by the bare cosine distance, e.g.
+    ``order_by(Embedding.vector.cosine_distance(query)).limit(k)``, to use the
+    HNSW index; wrapping the distance in an expression forces a full scan.
+    """
+
     __tablename__ = "embeddings"
 
     object_type: Mapped[str] = mapped_column(String, primary_key=True)
     object_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     vector: Mapped[list[float] | None] = mapped_column(Vector(1536))
 
+    __table_args__ = (
+        Index(
+            "ix_embeddings_vector_hnsw",
+            "vector",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"vector": "vector_cosine_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
 
 class Run(Base):
     __tablename__ = "runs"
@@ -177,12 +280,15 @@ class Run(Base):
     connector: Mapped[str] = mapped_column(String, nullable=False)
     started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    status: Mapped[str] = mapped_column(String, nullable=False)
+    # create_constraint keeps a CHECK on backends without native enums (SQLite).
+    status: Mapped[str] = mapped_column(
+        Enum(*RUN_STATUSES, name="run_status", create_constraint=True), nullable=False
+    )
     item_count: Mapped[int] = mapped_column(Integer, default=0)
     error_log: Mapped[str | None] = mapped_column(Text)
 
     __table_args__ = (
-        CheckConstraint("status IN ('queued','running','success','error')", name="runs_status_check"),
+        Index("ix_runs_started_at", "started_at"),
     )
 
 
@@ -195,3 +301,11 @@ class Schedule(Base):
     next_due_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     enabled: Mapped[bool] = mapped_column(Boolean, default=True)
 
+    __table_args__ = (
+        Index(
+            "ix_schedules_due",
+            "next_due_at",
+            postgresql_where=text("enabled"),
+        ).ddl_if(dialect="postgresql"),
+    )
+
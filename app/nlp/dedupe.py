@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from difflib import SequenceMatcher
+from typing import Sequence
 
 
 def exact_match(a: str, b: str) -> bool:
@@ -10,6 +11,54 @@ def exact_match(a: str, b: str) -> bool:
 
 
 def fuzzy_match(a: str, b: str, threshold: float = 0.85) -> bool:
-    ratio = SequenceMatcher(None, a.lower(), b.lower()).ratio()
-    return ratio >= threshold
+    matcher = SequenceMatcher(None, a.lower(), b.lower())
+    # real_quick_ratio/quick_ratio are cheap upper bounds on ratio(); most
+    # dissimilar pairs are rejected before the full matching-blocks pass.
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
 
+
+def fuzzy_pairs(names: Sequence[str], threshold: float = 0.85) -> list[tuple[int, int]]:
+    """Return ``(i, j)`` index pairs (``i < j``) of names similar at ``threshold``.
+
+    Use this for a whole batch instead of calling :func:`fuzzy_match` on every
+    pair; the result is exactly the pairs for which
+    ``fuzzy_match(names[i], names[j], threshold)`` holds. Names are visited in
+    length order, and the similarity ratio can never exceed
+    ``2 * shorter / (shorter + longer)``, so each name is only compared
+    against the run of partners short enough to possibly match.
+    """
+
+    lowered = [name.lower() for name in names]
+    order = sorted(range(len(lowered)), key=lambda index: len(lowered[index]))
+    pairs: list[tuple[int, int]] = []
+    # ratio() is not symmetric, so each pair is scored with the lower index
+    # as seq1 like fuzzy_match(names[i], names[j]) would. SequenceMatcher
+    # caches its analysis of seq2, so partners with a lower index reuse the
+    # cached one.
+    as_seq2 = SequenceMatcher()
+    for position, i in enumerate(order):
+        shorter = len(lowered[i])
+        as_seq2.set_seq2(lowered[i])
+        for j in order[position + 1 :]:
+            total = shorter + len(lowered[j])
+            # Same float expression difflib uses for real_quick_ratio(), so
+            # the cut-off can never reject a pair fuzzy_match would accept.
+            if total and 2.0 * shorter / total < threshold:
+                break
+            if j < i:
+                matcher = as_seq2
+                matcher.set_seq1(lowered[j])
+            else:
+                matcher = SequenceMatcher(None, lowered[i], lowered[j])
+            if (
+                matcher.real_quick_ratio() >= threshold
+                and matcher.quick_ratio() >= threshold
+                and matcher.ratio() >= threshold
+            ):
+                pairs.append((min(i, j), max(i, j)))
+    pairs.sort()
+    return pairs
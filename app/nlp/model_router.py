@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,6 +10,11 @@ from typing import Any, Callable, Dict
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 CapabilityFn = Callable[..., Any]
 
@@ -19,6 +25,14 @@ class Capability:
     run: CapabilityFn
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config(path: str, mtime_ns: int) -> dict[str, Any]:
+    # Keyed on mtime so an edited file is re-read; routers built from the same
+    # file version share one parsed (read-only) config.
+    with open(path, "r", encoding="utf-8") as fp:
+        return yaml.load(fp, Loader=_SafeLoader)
+
+
 class ModelRouter:
     def __init__(self, config_path: str | None = None) -> None:
         default_path = (
@@ -27,8 +41,7 @@ class ModelRouter:
             else Path(__file__).resolve().parents[1] / "infra" / "models.yaml"
         )
         path = Path(config_path) if config_path else default_path
-        with path.open("r", encoding="utf-8") as fp:
-            self._config: dict[str, Any] = yaml.safe_load(fp)
+        self._config: dict[str, Any] = _load_config(str(path), path.stat().st_mtime_ns)
         self._capabilities: Dict[str, Capability] = {}
 
     def register(self, capability: str, func: CapabilityFn) -> None:
@@ -6,20 +6,32 @@ from datetime import datetime
 from typing import Any
 
 
-INSTITUTIONAL_ANCHORS = {"caha_pdf", "guma", "artspace", "uog"}
-COMMUNITY_CHANNELS = {"reddit", "events"}
-SOCIAL_CHANNELS = {"instagram_stub", "tiktok_stub"}
+INSTITUTIONAL_ANCHORS = frozenset({"caha_pdf", "guma", "artspace", "uog"})
+COMMUNITY_CHANNELS = frozenset({"reddit", "events"})
+SOCIAL_CHANNELS = frozenset({"instagram", "tiktok"})
+
+_INSTITUTIONAL_WEIGHT = 40.0
+_COMMUNITY_WEIGHT = 30.0
+_SOCIAL_WEIGHT = 20.0
+_RECENCY_WEIGHT = 10.0
+
+# The channel groups are disjoint, so one lookup finds a channel's bucket.
+_CHANNEL_BUCKETS: dict[str, tuple[str, float]] = {
+    **dict.fromkeys(INSTITUTIONAL_ANCHORS, ("institutional", _INSTITUTIONAL_WEIGHT)),
+    **dict.fromkeys(COMMUNITY_CHANNELS, ("community", _COMMUNITY_WEIGHT)),
+    **dict.fromkeys(SOCIAL_CHANNELS, ("social", _SOCIAL_WEIGHT)),
+}
 
 
 def score_candidate(candidate_channel: str, metadata: dict[str, Any]) -> tuple[float, dict[str, float]]:
-    breakdown = {"institutional": 0.0, "community": 0.0, "social": 0.0, "recency": 0.0}
-    if candidate_channel in INSTITUTIONAL_ANCHORS or metadata.get("institutional_anchor"):
-        breakdown["institutional"] = 40.0
-    if candidate_channel in COMMUNITY_CHANNELS or metadata.get("community_signal"):
-        breakdown["community"] = 30.0
-    if candidate_channel in SOCIAL_CHANNELS:
-        breakdown["social"] = 20.0
-    breakdown["recency"] = 10.0
+    breakdown = {"institutional": 0.0, "community": 0.0, "social": 0.0, "recency": _RECENCY_WEIGHT}
+    bucket = _CHANNEL_BUCKETS.get(candidate_channel)
+    if bucket is not None:
+        breakdown[bucket[0]] = bucket[1]
+    if metadata.get("institutional_anchor"):
+        breakdown["institutional"] = _INSTITUTIONAL_WEIGHT
+    if metadata.get("community_signal"):
+        breakdown["community"] = _COMMUNITY_WEIGHT
     total = sum(breakdown.values())
     return total, breakdown
 
@@ -108,22 +108,39 @@ THEME_KEYWORDS: Mapping[str, Set[str]] = {
 }
 
 
-def detect_disciplines(text: str) -> Set[str]:
-    lowered = text.lower()
-    tags = {
-        discipline
-        for discipline, keywords in DISCIPLINE_KEYWORDS.items()
-        if any(kw in lowered for kw in keywords)
-    }
+def _compile(keywords: Mapping[str, Set[str]]) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    # A keyword that contains a shorter keyword of the same tag can never be
+    # the one that decides a match, so it is dropped from the scan table.
+    return tuple(
+        (tag, tuple(sorted(kw for kw in kws if not any(other != kw and other in kw for other in kws))))
+        for tag, kws in keywords.items()
+    )
+
+
+_DISCIPLINE_SCAN = _compile(DISCIPLINE_KEYWORDS)
+_THEME_SCAN = _compile(THEME_KEYWORDS)
+
+
+def _scan(lowered: str, table: tuple[tuple[str, tuple[str, ...]], ...]) -> Set[str]:
+    tags: Set[str] = set()
+    for tag, keywords in table:
+        for kw in keywords:
+            if kw in lowered:
+                tags.add(tag)
+                break
     return tags
 
 
+def detect_disciplines(text: str) -> Set[str]:
+    return _scan(text.lower(), _DISCIPLINE_SCAN)
+
+
 def detect_themes(text: str) -> Set[str]:
-    lowered = text.lower()
-    tags = {
-        theme
-        for theme, keywords in THEME_KEYWORDS.items()
-        if any(kw in lowered for kw in keywords)
-    }
-    return tags
+    return _scan(text.lower(), _THEME_SCAN)
 
+
+def detect_tags(text: str) -> tuple[Set[str], Set[str]]:
+    """Return ``(disciplines, themes)`` lowercasing ``text`` only once."""
+
+    lowered = text.lower()
+    return _scan(lowered, _DISCIPLINE_SCAN), _scan(lowered, _THEME_SCAN)
@@ -1,6 +1,9 @@
 """Pytest fixtures."""
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 
 @pytest.fixture(scope="session")
@@ -9,3 +12,19 @@ def sample_caha_pdf(tmp_path_factory):
     path.write_text("Sample CAHA data")
     return path
 
+
+@pytest.fixture()
+def worker_sessions(monkeypatch):
+    """Point the worker modules at a fresh in-memory database."""
+    from models import Base
+    from workers import scheduler, tasks
+
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    monkeypatch.setattr(tasks, "SessionLocal", factory)
+    monkeypatch.setattr(scheduler, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
@@ -7,45 +7,54 @@ from datetime import datetime, timezone
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+import models
+from models import Base, Candidate, Org, SessionLocal, Source, Talent, TalentOrg
+from models import session as session_module
 
 
 @pytest.fixture(scope="session")
 def api_client() -> TestClient:
     os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
-
-    from models import Base, session as session_module  # type: ignore[attr-defined]
+    os.environ["RESPONSE_CACHE_TTL"] = "0"
 
     test_engine = session_module._build_engine(os.environ["DATABASE_URL"])
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy
+    # emit BEGIN itself so clean_database can roll each test back.
+    @event.listens_for(test_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, _record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(test_engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
     session_module.engine = test_engine
     session_module.SessionLocal.configure(bind=test_engine)
 
     # Keep the public exports in sync with the updated engine.
-    import models as models_module
-
-    models_module.engine = test_engine
-    models_module.SessionLocal = session_module.SessionLocal
+    models.engine = test_engine
 
     Base.metadata.create_all(bind=test_engine)
 
     from api.main import create_app
-    from workers import scheduler
 
-    original_enqueue = scheduler.enqueue_due_jobs
-    scheduler.enqueue_due_jobs = lambda: None
     try:
         app = create_app()
         with TestClient(app) as client:
             yield client
     finally:
-        scheduler.enqueue_due_jobs = original_enqueue
         Base.metadata.drop_all(bind=test_engine)
 
 
 @pytest.fixture()
 def db_session():
-    from models import SessionLocal
-
-    session = SessionLocal()
+    # Seeded objects stay loaded after commit; assertions re-query rather
+    # than relying on expiry to pick up changes made through the API.
+    session = SessionLocal(expire_on_commit=False)
     try:
         yield session
     finally:
@@ -53,17 +62,27 @@ def db_session():
 
 
 @pytest.fixture(autouse=True)
-def clean_database():
-    from models import Base, engine
-
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    yield
+def clean_database(api_client):
+    """Run each test inside one outer transaction and roll it back afterwards.
+
+    The schema is created once per session; sessions opened by the tests and
+    by the app join the outer transaction, and their commits only release
+    savepoints, so cleanup is a single ROLLBACK instead of dropping and
+    recreating every table.
+    """
+    engine = models.engine
+    connection = engine.connect()
+    transaction = connection.begin()
+    SessionLocal.configure(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield
+    finally:
+        SessionLocal.configure(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
 def _make_source(db_session):
-    from models import Source
-
     source = Source(
         channel="instagram",
         url="https://example.com/post",
@@ -78,8 +97,6 @@ def _make_source(db_session):
 
 
 def test_candidate_filters_and_mutations(api_client: TestClient, db_session):
-    from models import Candidate
-
     source = _make_source(db_session)
     candidate_music = Candidate(
         source_id=source.id,
@@ -112,6 +129,19 @@ def test_candidate_filters_and_mutations(api_client: TestClient, db_session):
     assert resp.status_code == 200
     assert resp.json()["items"][0]["score"] == 0.82
 
+    resp = api_client.get("/api/candidates", params={"status": "pending"})
+    assert resp.status_code == 200
+    assert resp.json()["total"] == 2
+
+    resp = api_client.get("/api/candidates", params={"page": 3, "page_size": 1})
+    assert resp.status_code == 200
+    assert resp.json()["items"] == []
+    assert resp.json()["total"] == 2
+    assert resp.headers["x-total-count"] == "2"
+
+    resp = api_client.get("/api/candidates", params={"status": "nope"})
+    assert resp.status_code == 400
+
     approve_resp = api_client.post(f"/api/candidates/{candidate_music.id}/approve")
     assert approve_resp.status_code == 200
     assert approve_resp.json()["status"] == "approved"
@@ -157,18 +187,92 @@ def test_candidate_crud(api_client: TestClient, db_session):
     missing_resp = api_client.get(f"/api/candidates/{candidate_id}")
     assert missing_resp.status_code == 404
 
+    missing_approve_resp = api_client.post(f"/api/candidates/{candidate_id}/approve")
+    assert missing_approve_resp.status_code == 404
 
-def test_talent_filters_and_crud(api_client: TestClient, db_session):
-    from models import Org, Talent, TalentOrg
 
+def test_candidate_bulk_create(api_client: TestClient, db_session):
+    source = _make_source(db_session)
+
+    bulk_resp = api_client.post(
+        "/api/candidates/bulk",
+        json=[
+            {"source_id": source.id, "name": "First", "channel": "reddit"},
+            {
+                "source_id": source.id,
+                "name": "Second",
+                "channel": "events",
+                "metadata": {"discipline": "dance"},
+                "status": "watch",
+            },
+        ],
+    )
+    assert bulk_resp.status_code == 201
+    created = bulk_resp.json()
+    assert [item["name"] for item in created] == ["First", "Second"]
+    assert created[1]["metadata"] == {"discipline": "dance"}
+    assert created[1]["status"] == "watch"
+
+    list_resp = api_client.get("/api/candidates")
+    assert list_resp.json()["total"] == 2
+
+    bad_status_resp = api_client.post(
+        "/api/candidates/bulk",
+        json=[{"source_id": source.id, "name": "Bad", "channel": "reddit", "status": "nope"}],
+    )
+    assert bad_status_resp.status_code == 400
+
+    missing_source_resp = api_client.post(
+        "/api/candidates/bulk",
+        json=[{"source_id": source.id + 1, "name": "Orphan", "channel": "reddit"}],
+    )
+    assert missing_source_resp.status_code == 404
+
+    invalid_before_lookup_resp = api_client.post(
+        "/api/candidates",
+        json={"source_id": source.id + 1, "name": "Orphan", "channel": "reddit", "status": "nope"},
+    )
+    assert invalid_before_lookup_resp.status_code == 400
+
+
+def test_candidate_list_conditional_get(api_client: TestClient, db_session):
+    source = _make_source(db_session)
+    api_client.post(
+        "/api/candidates",
+        json={"source_id": source.id, "name": "Cached", "channel": "reddit"},
+    )
+
+    first_resp = api_client.get("/api/candidates")
+    assert first_resp.status_code == 200
+    etag = first_resp.headers["etag"]
+    assert first_resp.headers["x-total-count"] == "1"
+
+    not_modified_resp = api_client.get("/api/candidates", headers={"If-None-Match": etag})
+    assert not_modified_resp.status_code == 304
+
+    other_page_resp = api_client.get("/api/candidates", params={"page_size": 10}, headers={"If-None-Match": etag})
+    assert other_page_resp.status_code == 200
+
+    candidate_id = first_resp.json()["items"][0]["id"]
+    api_client.post(f"/api/candidates/{candidate_id}/approve")
+    changed_resp = api_client.get("/api/candidates", headers={"If-None-Match": etag})
+    assert changed_resp.status_code == 200
+    assert changed_resp.headers["etag"] != etag
+
+
+def test_talent_filters_and_crud(api_client: TestClient, db_session):
     org_music = Org(name="Guam Music Collective")
     org_dance = Org(name="Dance Assoc")
     talent_music = Talent(
         name="Perla",
         discipline="music",
         score=0.91,
+        themes=["decolonization", "language"],
+        location_tags=["hagatna"],
+    )
+    talent_dance = Talent(
+        name="Inarajan Crew", discipline="dance", score=0.7, themes=["language"], location_tags=["inarajan"]
     )
-    talent_dance = Talent(name="Inarajan Crew", discipline="dance", score=0.7)
     db_session.add_all([org_music, org_dance, talent_music, talent_dance])
     db_session.commit()
 
@@ -188,6 +292,14 @@ def test_talent_filters_and_crud(api_client: TestClient, db_session):
     assert resp.status_code == 200
     assert resp.json()["items"][0]["name"] == "Inarajan Crew"
 
+    resp = api_client.get("/api/talent", params={"theme": "decolonization"})
+    assert resp.status_code == 200
+    assert [item["name"] for item in resp.json()["items"]] == ["Perla"]
+
+    resp = api_client.get("/api/talent", params={"theme": "language", "location": "inarajan"})
+    assert resp.status_code == 200
+    assert [item["name"] for item in resp.json()["items"]] == ["Inarajan Crew"]
+
     resp = api_client.get("/api/talent", params={"min_score": 0.9})
     assert resp.status_code == 200
     assert resp.json()["items"][0]["score"] == 0.91
@@ -226,10 +338,21 @@ def test_schedule_crud(api_client: TestClient):
     )
     assert create_resp.status_code == 201
 
+    duplicate_resp = api_client.post(
+        "/api/schedules",
+        json={"connector": "reddit", "cadence_cron": "0 * * * *"},
+    )
+    assert duplicate_resp.status_code == 409
+
     list_resp = api_client.get("/api/schedules")
     assert list_resp.status_code == 200
     assert list_resp.json()["total"] == 1
 
+    past_end_resp = api_client.get("/api/schedules", params={"page": 2})
+    assert past_end_resp.status_code == 200
+    assert past_end_resp.json()["items"] == []
+    assert past_end_resp.json()["total"] == 1
+
     update_resp = api_client.put(
         "/api/schedules/reddit",
         json={"enabled": False},
@@ -237,6 +360,11 @@ def test_schedule_crud(api_client: TestClient):
     assert update_resp.status_code == 200
     assert update_resp.json()["enabled"] is False
 
+    enabled_resp = api_client.get("/api/schedules", params={"enabled": True})
+    assert enabled_resp.json()["total"] == 0
+    disabled_resp = api_client.get("/api/schedules", params={"enabled": False})
+    assert disabled_resp.json()["total"] == 1
+
     delete_resp = api_client.delete("/api/schedules/reddit")
     assert delete_resp.status_code == 204
 
@@ -274,3 +402,77 @@ def test_logs_crud(api_client: TestClient):
 
     missing_resp = api_client.get(f"/api/logs/{log_id}")
     assert missing_resp.status_code == 404
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value.encode() if isinstance(value, str) else value
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, b"0")) + 1).encode()
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        return []
+
+
+def test_cached_response_hits_and_invalidates(monkeypatch):
+    from api import cache
+
+    fake = _FakeRedis()
+    monkeypatch.setattr(cache, "_get_client", lambda: fake)
+    calls: list[int] = []
+
+    @cache.cached_response("things")
+    def list_things(page: int = 1, db=None):
+        calls.append(page)
+        return {"page": page, "at": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+
+    assert list_things(page=1, db=object()) == {"page": 1, "at": "2024-01-01T00:00:00+00:00"}
+    assert list_things(page=1, db=object())["page"] == 1
+    assert calls == [1]
+
+    list_things(page=2, db=object())
+    assert calls == [1, 2]
+
+    cache.invalidate("things")
+    list_things(page=1, db=object())
+    assert calls == [1, 2, 1]
+
+
+def test_cached_response_serves_stale_on_database_error(monkeypatch):
+    from api import cache
+
+    fake = _FakeRedis()
+    monkeypatch.setattr(cache, "_get_client", lambda: fake)
+    healthy = {"value": True}
+    error = {"value": OperationalError("SELECT 1", {}, Exception("connection refused"))}
+
+    @cache.cached_response("flaky")
+    def list_flaky(page: int = 1, db=None):
+        if not healthy["value"]:
+            raise error["value"]
+        return {"page": page}
+
+    assert list_flaky(page=1) == {"page": 1}
+    cache.invalidate("flaky")
+    healthy["value"] = False
+
+    stale = list_flaky(page=1)
+    assert stale.headers["x-cache"] == "stale"
+    assert stale.body == b'{"page": 1}'
+
+    with pytest.raises(OperationalError):
+        list_flaky(page=2)
+
+    error["value"] = ProgrammingError("SELECT nope", {}, Exception("syntax error"))
+    with pytest.raises(ProgrammingError):
+        list_flaky(page=1)
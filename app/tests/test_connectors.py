@@ -1,3 +1,5 @@
+from connectors import caha_pdf
+from connectors._mentions import scan_mentions
 from connectors.caha_pdf import CAHAPDFConnector
 from connectors.reddit import RedditConnector
 from connectors.events import EventsConnector
@@ -13,6 +15,52 @@ def test_caha_connector_fetch(tmp_path):
     assert sources[0].channel == "caha_pdf"
 
 
+def _write_pdf(path, *pages):
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None]
+    font = 3 + 2 * len(pages)
+    kids = []
+    for lines in pages:
+        stream = "BT /F1 12 Tf 72 720 Td 14 TL " + " ".join(f"({line}) Tj T*" for line in lines) + " ET"
+        kids.append(f"{len(objects) + 1} 0 R")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {len(objects) + 2} 0 R "
+            f"/Resources << /Font << /F1 {font} 0 R >> >> >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>"
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode()
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    body += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(body)
+
+
+def test_caha_extract_backends_agree(tmp_path):
+    pdf_path = tmp_path / "caha.pdf"
+    _write_pdf(pdf_path, ["Name Discipline", "Jane Doe - Painter", "Juan Cruz - Weaver"])
+    extracted = []
+    for use_pdfium in (True, False):
+        connector = CAHAPDFConnector(pdf_path=pdf_path, use_pdfium=use_pdfium)
+        payload = connector.fetch(None)[0]
+        extracted.append([candidate.name for candidate in connector.extract(payload)])
+    assert extracted[0] == extracted[1] == ["Jane Doe - Painter", "Juan Cruz - Weaver"]
+
+
+def test_caha_pdfplumber_workers_keep_page_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(caha_pdf, "_PAGES_PER_WORKER", 1)
+    monkeypatch.setattr(caha_pdf, "_available_cpus", lambda: 3)
+    pdf_path = tmp_path / "caha.pdf"
+    _write_pdf(pdf_path, *([f"Artist {page} - Painter"] for page in range(7)))
+    lines = list(caha_pdf._iter_pdf_lines(pdf_path))
+    assert lines == [f"Artist {page} - Painter" for page in range(7)]
+
+
 def test_reddit_extract_handles(tmp_path):
     html = "@artist1 https://example.com"
     fixture = tmp_path / "reddit.html"
@@ -24,6 +72,24 @@ def test_reddit_extract_handles(tmp_path):
     assert any("@artist1" in c.name for c in candidates)
 
 
+def test_reddit_extract_handles_inside_urls(tmp_path):
+    fixture = tmp_path / "reddit.html"
+    fixture.write_text("Follow https://www.tiktok.com/@weaver671 and @artist1", encoding="utf-8")
+    connector = RedditConnector()
+    payload = connector.fetch(None)[0]
+    payload.raw_blob_ptr = str(fixture)
+    names = [c.name for c in connector.extract(payload)]
+    assert names == ["@weaver671", "@artist1", "https://www.tiktok.com/@weaver671"]
+
+
+def test_reddit_fetch_hashes_thread(tmp_path):
+    thread = tmp_path / "reddit.html"
+    thread.write_text("@artist1", encoding="utf-8")
+    payload = RedditConnector(thread_path=thread).fetch(None)[0]
+    assert payload.content_hash and payload.content_hash.startswith("reddit:")
+    assert payload.raw_blob_ptr == str(thread)
+
+
 def test_events_extract(tmp_path):
     fixture = tmp_path / "events.txt"
     fixture.write_text("Fresku Fest\nEIF", encoding="utf-8")
@@ -34,6 +100,16 @@ def test_events_extract(tmp_path):
     assert len(candidates) == 2
 
 
+def test_events_fetch_hashes_listing(tmp_path):
+    listing = tmp_path / "events.txt"
+    listing.write_text("Fresku Fest", encoding="utf-8")
+    payload = EventsConnector(listing_path=listing).fetch(None)[0]
+    assert payload.content_hash and payload.content_hash.startswith("events:")
+
+    missing = EventsConnector(listing_path=tmp_path / "missing.txt").fetch(None)[0]
+    assert missing.content_hash is None
+
+
 def test_instagram_extract_handles_and_tags():
     connector = InstagramConnector()
     payload = connector.fetch(None)[0]
@@ -58,3 +134,9 @@ def test_tiktok_extract_handles_and_tags():
     assert "#Decolonize" in hashtags
     assert all(candidate.metadata.get("timestamp") for candidate in candidates)
     assert all(candidate.metadata.get("raw_payload_ptr") for candidate in candidates)
+
+
+def test_scan_mentions_splits_handles_and_hashtags():
+    handles, hashtags = scan_mentions("Live with @ritidian.beats#GuamArt @a and #Guåhan @weaver_collective")
+    assert handles == ["ritidian.beats", "weaver_collective"]
+    assert hashtags == ["GuamArt", "Guåhan"]
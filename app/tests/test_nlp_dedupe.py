@@ -0,0 +1,40 @@
+import random
+
+from nlp.dedupe import exact_match, fuzzy_match, fuzzy_pairs
+
+
+def test_exact_match_ignores_case_and_whitespace():
+    assert exact_match("  Ritidian Beats ", "ritidian beats")
+
+
+def test_fuzzy_match_threshold():
+    assert fuzzy_match("Ritidian Beats", "Ritidian Beatz")
+    assert not fuzzy_match("Ritidian Beats", "Weaver Collective")
+    assert not fuzzy_match("Ritidian Beats", "Ritidian Beats Collective Guam")
+
+
+def _pairwise(names, threshold):
+    return [
+        (i, j)
+        for i in range(len(names))
+        for j in range(i + 1, len(names))
+        if fuzzy_match(names[i], names[j], threshold)
+    ]
+
+
+def test_fuzzy_pairs_keeps_pairs_at_the_length_bound():
+    # 2 * 17 / 40 == 0.85 exactly; a float bound of 22.999... used to drop it.
+    names = ["sound collective studio", "collective studio"]
+    assert fuzzy_match(*names)
+    assert fuzzy_pairs(names) == [(0, 1)]
+
+
+def test_fuzzy_pairs_agrees_with_fuzzy_match_on_random_batches():
+    rng = random.Random(671)
+    for _ in range(500):
+        names = [
+            "".join(rng.choice("ab ") for _ in range(rng.randint(0, 8)))
+            for _ in range(rng.randint(2, 8))
+        ]
+        threshold = rng.choice((0.5, 0.6, 0.75, 0.85))
+        assert fuzzy_pairs(names, threshold) == _pairwise(names, threshold), (names, threshold)
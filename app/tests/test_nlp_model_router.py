@@ -0,0 +1,18 @@
+import os
+
+from nlp.model_router import ModelRouter
+
+
+def test_model_router_reuses_parsed_config_until_file_changes(tmp_path):
+    config_path = tmp_path / "models.yaml"
+    config_path.write_text("capabilities:\n  summarize: local\n", encoding="utf-8")
+
+    first = ModelRouter(str(config_path))
+    second = ModelRouter(str(config_path))
+    assert first.config == {"capabilities": {"summarize": "local"}}
+    assert second.config is first.config
+
+    config_path.write_text("capabilities:\n  summarize: remote\n", encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert ModelRouter(str(config_path)).config == {"capabilities": {"summarize": "remote"}}
@@ -0,0 +1,11 @@
+from nlp.scoring import score_candidate
+
+
+def test_score_candidate_buckets_channels():
+    assert score_candidate("caha_pdf", {}) == (
+        50.0,
+        {"institutional": 40.0, "community": 0.0, "social": 0.0, "recency": 10.0},
+    )
+    assert score_candidate("reddit", {"institutional_anchor": True})[0] == 80.0
+    assert score_candidate("tiktok", {})[1]["social"] == 20.0
+    assert score_candidate("unknown", {"community_signal": True})[0] == 40.0
@@ -1,4 +1,10 @@
-from nlp.taggers import detect_disciplines, detect_themes
+from nlp.taggers import (
+    DISCIPLINE_KEYWORDS,
+    THEME_KEYWORDS,
+    detect_disciplines,
+    detect_tags,
+    detect_themes,
+)
 
 
 def test_detect_music_and_visual_disciplines():
@@ -34,3 +40,10 @@ def test_detect_performing_discipline():
     text = "Dancer and choreographer performing a new theatre piece at Artspace Guahan."
     tags = detect_disciplines(text)
     assert "performing" in tags
+
+
+def test_detect_tags_matches_every_keyword():
+    for keywords, position in ((DISCIPLINE_KEYWORDS, 0), (THEME_KEYWORDS, 1)):
+        for tag, kws in keywords.items():
+            for kw in kws:
+                assert tag in detect_tags(f"Known for {kw.upper()} work")[position]
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+
+from rq import Queue
+from sqlalchemy import func, select
+
+
+class FakeQueue:
+    prepare_data = staticmethod(Queue.prepare_data)
+
+    def __init__(self):
+        self.batches = []
+
+    def enqueue_many(self, jobs):
+        self.batches.append([job.args for job in jobs])
+
+
+def test_enqueue_due_jobs_batches_only_due_connectors(worker_sessions, monkeypatch):
+    from connectors.base import registry
+    from models import Schedule
+    from workers import scheduler
+
+    now = datetime(2026, 10, 15, 12, 0, tzinfo=timezone.utc)
+    with worker_sessions() as session:
+        session.add_all(
+            [
+                Schedule(connector="reddit", cadence_cron="0 * * * *", next_due_at=now - timedelta(minutes=5)),
+                Schedule(connector="events", cadence_cron="0 * * * *", next_due_at=now + timedelta(hours=1)),
+                Schedule(connector="tiktok", cadence_cron="0 * * * *", enabled=False),
+                Schedule(connector="instagram", cadence_cron="0 * * * *", last_run_at=now + timedelta(hours=1)),
+            ]
+        )
+        session.commit()
+
+    queue = FakeQueue()
+    monkeypatch.setattr(scheduler, "_queue", lambda: queue)
+    invalidated = []
+    monkeypatch.setattr(scheduler, "invalidate", invalidated.append)
+    scheduler.enqueue_due_jobs(now=now)
+    assert invalidated == ["schedules"]
+
+    # Rows created on the fly have never run, so they are due immediately.
+    expected = {connector.name for connector in registry.all()} - {"events", "tiktok", "instagram"}
+    assert len(queue.batches) == 1
+    assert {args[0] for args in queue.batches[0]} == expected
+
+    with worker_sessions() as session:
+        reddit = session.get(Schedule, "reddit")
+        assert reddit.last_run_at.replace(tzinfo=timezone.utc) == now
+        assert session.get(Schedule, "events").last_run_at is None
+        assert session.scalar(select(func.count()).select_from(Schedule)) == len(registry.all())
+
+
+def test_calculate_next_due_reuses_parsed_cadence():
+    from workers.scheduler import calculate_next_due
+
+    now = datetime(2026, 10, 15, 12, 7, tzinfo=timezone.utc)
+    assert calculate_next_due("0 * * * *", None, now) == datetime(2026, 10, 15, 13, 0, tzinfo=timezone.utc)
+    # A later call with an earlier base must not be affected by the first.
+    earlier = datetime(2026, 10, 15, 9, 30)
+    assert calculate_next_due("0 * * * *", earlier, now) == datetime(2026, 10, 15, 10, 0, tzinfo=timezone.utc)
+
+
+def test_calculate_next_due_daily_fast_path_matches_croniter():
+    from croniter import croniter
+
+    from workers.scheduler import calculate_next_due
+
+    offset = timezone(timedelta(hours=10))
+    bases = [
+        datetime(2026, 10, 15, 5, 59, 59, tzinfo=timezone.utc),
+        datetime(2026, 10, 15, 6, 0, tzinfo=timezone.utc),
+        datetime(2026, 12, 31, 23, 30, tzinfo=timezone.utc),
+        datetime(2026, 10, 15, 8, 0, 30, tzinfo=offset),
+    ]
+    for cron in ("0 6 * * *", "30 23 * * *", "0 8 * * *"):
+        for base in bases:
+            assert calculate_next_due(cron, base, base) == croniter(cron, base).get_next(datetime)
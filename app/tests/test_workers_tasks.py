@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+
+def test_run_connector_bulk_inserts_candidates_once_per_source(worker_sessions, monkeypatch):
+    from models import Candidate, Run, Schedule
+    from workers import tasks
+
+    invalidated = []
+    monkeypatch.setattr(tasks, "invalidate", invalidated.append)
+    tasks.run_connector("events")
+    tasks.run_connector("events")
+    assert invalidated == ["runs", "candidates", "schedules"] * 2
+
+    with worker_sessions() as session:
+        candidates = session.scalars(select(Candidate).order_by(Candidate.id)).all()
+        assert [candidate.name for candidate in candidates] == [
+            "Fresku Fest Headliners",
+            "Chamorro Village Vendor Showcase",
+            "EIF Sunset Stage",
+        ]
+        assert all(candidate.status == "pending" for candidate in candidates)
+        runs = session.scalars(select(Run).order_by(Run.id)).all()
+        assert [(run.status, run.item_count) for run in runs] == [("success", 3), ("success", 0)]
+        assert session.scalar(select(func.count()).select_from(Schedule)) == 1
+
+
+def test_run_connector_records_partial_run_when_a_source_fails(worker_sessions, monkeypatch):
+    from connectors import load_connectors
+    from connectors.base import registry
+    from models import Candidate, Run, Schedule
+    from workers import tasks
+
+    load_connectors()
+    connector = registry.get("events")
+    (payload,) = connector.fetch(None)
+    payloads = [payload.model_copy(update={"content_hash": f"events:{n}"}) for n in range(2)]
+    monkeypatch.setattr(connector, "fetch", lambda since: payloads)
+
+    real_bulk_insert = tasks.bulk_insert
+    calls = []
+
+    def flaky_bulk_insert(session, model, rows):
+        calls.append(model)
+        if len(calls) == 2:
+            # A NOT NULL violation leaves the session needing a rollback,
+            # like a real database error mid-run.
+            session.add(Candidate(source_id=None, name=None, channel="events", evidence=""))
+            session.flush()
+        return real_bulk_insert(session, model, rows)
+
+    monkeypatch.setattr(tasks, "bulk_insert", flaky_bulk_insert)
+    tasks.run_connector("events")
+
+    with worker_sessions() as session:
+        assert session.scalar(select(func.count()).select_from(Candidate)) == 3
+        run = session.scalars(select(Run)).one()
+        assert (run.status, run.item_count) == ("error", 3)
+        assert run.finished_at is not None
+        assert session.scalar(select(func.count()).select_from(Schedule)) == 1
+
+
+def test_status_columns_reject_unknown_values_without_native_enums(worker_sessions):
+    from models import Candidate, Run, Source
+
+    with worker_sessions() as session:
+        session.add(Run(connector="events", started_at=datetime.now(timezone.utc), status="crashed"))
+        with pytest.raises(IntegrityError):
+            session.flush()
+        session.rollback()
+
+        source = Source(channel="events", fetched_at=datetime.now(timezone.utc))
+        session.add(Candidate(source=source, name="Jane Doe", channel="events", status="rejected"))
+        with pytest.raises(IntegrityError):
+            session.flush()
@@ -1,7 +1,26 @@
-"""Worker module exports."""
+"""Worker module exports.
 
-from .scheduler import enqueue_due_jobs
-from .tasks import run_connector
+The scheduler and tasks pull in Redis, RQ and croniter, so they are imported
+only when one of the exported names is first accessed rather than whenever
+the package is touched.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    "enqueue_due_jobs": "scheduler",
+    "run_connector": "tasks",
+}
 
-__all__ = ["enqueue_due_jobs", "run_connector"]
 
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+
+
+__all__ = ["enqueue_due_jobs", "run_connector"]
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
-from datetime import datetime, timezone
+import re
+from datetime import datetime, timedelta, timezone
 
 from croniter import croniter
 from redis import Redis
 from rq import Queue
 
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 
+from api.cache import invalidate
+from connectors import load_connectors
 from connectors.base import registry
 from models import Schedule, SessionLocal
 
@@ -19,49 +24,106 @@ from models import Schedule, SessionLocal
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _cron_iterator(cron: str) -> croniter:
+    # Parsing and expanding the expression is most of croniter's cost, so keep
+    # one iterator per cadence and only move its start point. Callers (the
+    # scheduler tick, a forked RQ job) are single-threaded.
+    return croniter(cron)
+
+
+# "M H * * *": fire once a day at a fixed time, the most common cadence.
+_DAILY_CRON = re.compile(r"(\d{1,2}) (\d{1,2}) \* \* \*")
+
+
+def _next_daily(cron: str, base: datetime) -> datetime | None:
+    """Next fire time for a plain daily cadence, or None to defer to croniter."""
+
+    match = _DAILY_CRON.fullmatch(cron)
+    # Day arithmetic only matches croniter's wall-clock rules on fixed offsets.
+    if match is None or not isinstance(base.tzinfo, timezone):
+        return None
+    minute, hour = int(match.group(1)), int(match.group(2))
+    if minute > 59 or hour > 23:
+        return None
+    candidate = base.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate <= base:
+        candidate += timedelta(days=1)
+    return candidate
+
+
 def calculate_next_due(cron: str, last_run: datetime | None, now: datetime) -> datetime:
     """Return the next datetime matching the cron schedule."""
 
     base = last_run or now
     if base.tzinfo is None:
         base = base.replace(tzinfo=timezone.utc)
-    iterator = croniter(cron, base)
+    daily = _next_daily(cron, base)
+    if daily is not None:
+        return daily
+    iterator = _cron_iterator(cron)
+    iterator.set_current(base, force=True)
     next_occurrence = iterator.get_next(datetime)
     if next_occurrence.tzinfo is None:
         next_occurrence = next_occurrence.replace(tzinfo=timezone.utc)
     return next_occurrence
 
 
+@functools.lru_cache(maxsize=1)
+def _queue() -> Queue:
+    # Built once per process so later ticks reuse the Redis connection pool.
+    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    return Queue("connectors", connection=Redis.from_url(redis_url))
+
+
 def _ensure_schedule_rows(session: Session) -> None:
+    # One query for the existing names instead of a lookup per connector.
+    existing = set(session.scalars(select(Schedule.connector)))
     for connector in registry.all():
-        schedule = session.get(Schedule, connector.name)
-        if schedule is None:
-            schedule = Schedule(
-                connector=connector.name,
-                cadence_cron=connector.default_cadence,
-                enabled=True,
+        if connector.name not in existing:
+            session.add(
+                Schedule(
+                    connector=connector.name,
+                    cadence_cron=connector.default_cadence,
+                    enabled=True,
+                )
             )
-            session.add(schedule)
 
 
 def enqueue_due_jobs(now: datetime | None = None) -> None:
     """Enqueue any connectors that are due to run."""
 
+    load_connectors()
     current_time = now or datetime.now(timezone.utc)
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    redis = Redis.from_url(redis_url)
-    queue = Queue("connectors", connection=redis)
+    queue = _queue()
 
     with SessionLocal() as session:
         _ensure_schedule_rows(session)
         session.flush()
 
-        schedules = (
-            session.query(Schedule)
-            .filter(Schedule.enabled.is_(True))
-            .all()
-        )
+        # Only due rows come back, locked so a second worker process starting
+        # at the same time skips them instead of enqueueing them again. A row
+        # is due by next_due_at, or by last_run_at when it has none; spelled
+        # out rather than via coalesce() so ix_schedules_due stays usable.
+        schedules = session.scalars(
+            select(Schedule)
+            .where(
+                Schedule.enabled,
+                or_(
+                    Schedule.next_due_at <= current_time,
+                    and_(
+                        Schedule.next_due_at.is_(None),
+                        or_(Schedule.last_run_at.is_(None), Schedule.last_run_at <= current_time),
+                    ),
+                ),
+            )
+            .with_for_update(skip_locked=True)
+        ).all()
 
+        jobs = []
+        # Every due row advances from the same current_time, so connectors
+        # sharing a cadence share one croniter evaluation.
+        next_due_by_cron: dict[str, datetime] = {}
         for schedule in schedules:
             try:
                 connector = registry.get(schedule.connector)
@@ -69,16 +131,20 @@ def enqueue_due_jobs(now: datetime | None = None) -> None:
                 logger.warning("Connector %s not registered", schedule.connector)
                 continue
 
-            due_at = schedule.next_due_at or schedule.last_run_at
-            if due_at is None or due_at <= current_time:
-                logger.info("Enqueuing connector run for %s", connector.name)
-                queue.enqueue("workers.tasks.run_connector", connector.name, job_timeout="30m")
-                schedule.last_run_at = current_time
-                schedule.next_due_at = calculate_next_due(
-                    schedule.cadence_cron,
-                    current_time,
-                    current_time,
-                )
-
+            logger.info("Enqueuing connector run for %s", connector.name)
+            jobs.append(
+                queue.prepare_data("workers.tasks.run_connector", args=(connector.name,), timeout="30m")
+            )
+            schedule.last_run_at = current_time
+            next_due = next_due_by_cron.get(schedule.cadence_cron)
+            if next_due is None:
+                next_due = calculate_next_due(schedule.cadence_cron, current_time, current_time)
+                next_due_by_cron[schedule.cadence_cron] = next_due
+            schedule.next_due_at = next_due
+
+        if jobs:
+            # One pipelined round trip to Redis for the whole batch.
+            queue.enqueue_many(jobs)
         session.commit()
 
+    invalidate("schedules")
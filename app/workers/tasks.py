@@ -6,7 +6,8 @@ import logging
 import traceback
 from datetime import datetime, timezone
 
-from connectors import caha_pdf, events, instagram_stub, reddit, tiktok_stub  # noqa: F401
+from api.cache import invalidate
+from connectors import load_connectors
 from connectors.base import registry
 from models import (
     Candidate as CandidateModel,
@@ -14,6 +15,8 @@ from models import (
     Schedule,
     SessionLocal,
     Source,
+    bulk_insert,
+    insert_if_absent,
 )
 from workers.scheduler import calculate_next_due
 
@@ -22,6 +25,7 @@ logger = logging.getLogger(__name__)
 
 
 def run_connector(connector_name: str) -> None:
+    load_connectors()
     connector = registry.get(connector_name)
     started_at = datetime.now(timezone.utc)
 
@@ -33,48 +37,57 @@ def run_connector(connector_name: str) -> None:
         item_total = 0
 
         try:
-            sources = connector.fetch(None)
-            for payload in sources:
-                if payload.content_hash:
-                    existing = (
-                        session.query(Source)
-                        .filter(Source.content_hash == payload.content_hash)
-                        .one_or_none()
-                    )
-                    if existing:
-                        logger.info("Skipping duplicate source %s", payload.content_hash)
-                        continue
-
-                source = Source(
-                    channel=payload.channel,
-                    url=payload.url,
-                    kind=payload.kind,
-                    fetched_at=payload.fetched_at,
-                    content_hash=payload.content_hash,
-                    raw_blob_ptr=payload.raw_blob_ptr,
-                    meta=payload.meta,
+            for payload in connector.fetch(None):
+                source_id = insert_if_absent(
+                    session,
+                    Source,
+                    {
+                        "channel": payload.channel,
+                        "url": payload.url,
+                        "kind": payload.kind,
+                        "fetched_at": payload.fetched_at,
+                        "content_hash": payload.content_hash,
+                        "raw_blob_ptr": payload.raw_blob_ptr,
+                        "meta": payload.meta,
+                    },
+                    "content_hash",
                 )
-                session.add(source)
-                session.flush()
+                if source_id is None:
+                    logger.info("Skipping duplicate source %s", payload.content_hash)
+                    continue
 
                 candidates = connector.extract(payload)
-                for candidate in candidates:
-                    session.add(
-                        CandidateModel(
-                            source_id=source.id,
-                            name=candidate.name,
-                            channel=candidate.channel,
-                            evidence=candidate.evidence,
-                            metadata_json=candidate.metadata,
-                        )
-                    )
-                item_total += len(candidates)
+                inserted = bulk_insert(
+                    session,
+                    CandidateModel,
+                    [
+                        {
+                            "source_id": source_id,
+                            "name": candidate.name,
+                            "channel": candidate.channel,
+                            "evidence": candidate.evidence,
+                            "metadata_json": candidate.metadata,
+                        }
+                        for candidate in candidates
+                    ],
+                )
+                # Commit per source so a long fetch neither holds one open
+                # transaction for the whole run nor keeps its rows pending.
+                session.commit()
+                item_total += inserted
 
             run.status = "success"
             run.item_count = item_total
-        except Exception as exc:  # pragma: no cover - safety
+        except Exception as exc:
             logger.exception("Connector %s failed", connector_name)
+            # Sources committed before the failure stay; discard the failed
+            # one and record the run against what was actually stored. A run
+            # that had not been committed yet is dropped by the rollback, so
+            # add it back.
+            session.rollback()
+            session.add(run)
             run.status = "error"
+            run.item_count = item_total
             run.error_log = f"{exc}\n{traceback.format_exc()}"
         finally:
             run.finished_at = datetime.now(timezone.utc)
@@ -111,3 +124,6 @@ def run_connector(connector_name: str) -> None:
 
             session.commit()
 
+    # Cached API list pages would otherwise keep serving pre-run results.
+    for namespace in ("runs", "candidates", "schedules"):
+        invalidate(namespace)
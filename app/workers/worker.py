@@ -0,0 +1,48 @@
+"""RQ worker entrypoint.
+
+``rq worker`` forks a work horse per job, and anything the horse imports is
+thrown away when it exits. Importing the task module and every connector in
+the parent first means each forked job starts with them already loaded
+instead of re-importing SQLAlchemy, pdfplumber and friends per run.
+
+The parent also enqueues due connector jobs once on startup, which keeps
+the scheduler and connectors out of the API processes. It then disposes of
+the engine's pool: the forked horses would otherwise inherit (and share) the
+scheduler's connection.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+from redis import Redis
+from rq import Worker
+
+from connectors import load_connectors
+from models import engine
+from workers.scheduler import enqueue_due_jobs
+
+
+QUEUE_NAMES = ("connectors",)
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    load_connectors()
+    import workers.tasks  # noqa: F401  (preloaded for the forked horses)
+
+    try:
+        enqueue_due_jobs()
+    except Exception:  # pragma: no cover - safety
+        logger.exception("Failed to enqueue due jobs on startup")
+    finally:
+        engine.dispose()
+
+    redis = Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    Worker(list(QUEUE_NAMES), connection=redis).work()
+
+
+if __name__ == "__main__":
+    main()